@@ -7,6 +7,14 @@ This will merge votes with the same agenda item and preserve individual vote dat
 import json
 from collections import defaultdict
 
+def _hashable(agenda_item):
+    """Hashable grouping key for an agenda item; dicts key on all their fields, tagged so they never equal a string"""
+    if isinstance(agenda_item, str):
+        return agenda_item
+    if isinstance(agenda_item, dict):
+        return ('dict', tuple(sorted((key, _hashable(value)) for key, value in agenda_item.items())))
+    return (type(agenda_item).__name__, str(agenda_item))
+
 def consolidate_votes():
     """Consolidate duplicate votes by agenda item."""
 
@@ -30,9 +38,8 @@ def consolidate_votes():
     grouped_votes = defaultdict(list)
 
     for vote in enhanced_votes:
-        meeting_id = vote.get('meeting_id')
-        agenda_item = vote.get('agenda_item', '')
-        key = f"{meeting_id}_{agenda_item}"
+        # Tuple key avoids formatting a fresh string per vote
+        key = (vote.get('meeting_id'), _hashable(vote.get('agenda_item', '')))
         grouped_votes[key].append(vote)
 
     print(f"Grouped votes into {len(grouped_votes)} unique agenda items")
@@ -120,8 +127,14 @@ def consolidate_votes():
         meeting['total_votes'] = len(meeting_votes)
 
         # Calculate vote results
-        passed = sum(1 for v in meeting_votes if v.get('result', '').lower().startswith('pass'))
-        failed = sum(1 for v in meeting_votes if v.get('result', '').lower().startswith('fail'))
+        passed = failed = 0
+        for v in meeting_votes:
+            # Lowercase once per vote for both checks
+            result = (v.get('result') or '').lower()
+            if result.startswith('pass'):
+                passed += 1
+            elif result.startswith('fail'):
+                failed += 1
 
         meeting['vote_results'] = {
             'passed': passed,
@@ -79,7 +79,7 @@ class Torrance2021MeetingDiscoverer:
         response = self.session.get(url, timeout=30)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         meetings = []
 
         # Look for meeting links
@@ -117,7 +117,7 @@ class Torrance2021MeetingDiscoverer:
                 response = self.session.get(url, timeout=30)
                 response.raise_for_status()
 
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml')
                 meeting_links = soup.find_all('a', href=re.compile(r'clip_id=\d+'))
 
                 for link in meeting_links:
@@ -320,7 +320,7 @@ class Torrance2021MeetingDiscoverer:
         logger.info(f"📊 Total meetings: {len(meetings)}")
         logger.info("=" * 60)
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main entry point"""
     import argparse
 
@@ -328,7 +328,7 @@ def main():
     parser.add_argument('--output', default='2021_meetings.json', help='Output file for meetings')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose logging')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Configure logging level
     if args.verbose:
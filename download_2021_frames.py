@@ -15,6 +15,7 @@ import json
 import os
 import sys
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 from datetime import datetime
 from typing import Dict, List, Any, Optional
@@ -23,6 +24,7 @@ import time
 from pathlib import Path
 import subprocess
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Configure logging
 logging.basicConfig(
@@ -38,13 +40,18 @@ logger = logging.getLogger(__name__)
 class Torrance2021FrameDownloader:
     """Downloads frames from 2021 meetings"""
 
-    def __init__(self, data_dir: str = "2021_meetings_data"):
+    def __init__(self, data_dir: str = "2021_meetings_data", pool_size: int = 8):
         self.data_dir = data_dir
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
 
+        # Keep one reusable keep-alive connection per concurrent download thread
+        adapter = HTTPAdapter(pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         # Create data directory
         os.makedirs(data_dir, exist_ok=True)
 
@@ -284,30 +291,40 @@ class Torrance2021FrameDownloader:
 
         logger.info(f"✅ Created {frame_count} placeholder frames")
 
-    def download_all_meetings(self, meetings: List[Dict[str, Any]]):
+    def _download_one(self, meeting: Dict[str, Any]) -> bool:
+        """Download one meeting's frames, logging rather than raising on failure"""
+        meeting_id = meeting['clip_id']
+
+        try:
+            if self.download_meeting_frames(meeting):
+                logger.info(f"✅ Successfully downloaded frames for meeting {meeting_id}")
+                return True
+
+            logger.error(f"❌ Failed to download frames for meeting {meeting_id}")
+        except Exception as e:
+            logger.error(f"❌ Error processing meeting {meeting_id}: {e}")
+
+        return False
+
+    def download_all_meetings(self, meetings: List[Dict[str, Any]], max_workers: int = 8):
         """Download frames for all meetings"""
         logger.info(f"🚀 Starting frame download for {len(meetings)} meetings...")
 
         successful_downloads = 0
 
-        for i, meeting in enumerate(meetings, 1):
-            meeting_id = meeting['clip_id']
-            logger.info(f"\n📋 Downloading meeting {i}/{len(meetings)}: {meeting_id}")
+        # Each meeting is directory setup plus network/ffmpeg waits, so several
+        # meetings can be prepared concurrently on threads
+        workers = max(1, min(max_workers, len(meetings)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._download_one, meeting) for meeting in meetings]
 
-            try:
-                if self.download_meeting_frames(meeting):
+            for i, future in enumerate(as_completed(futures), 1):
+                if future.result():
                     successful_downloads += 1
-                    logger.info(f"✅ Successfully downloaded frames for meeting {meeting_id}")
-                else:
-                    logger.error(f"❌ Failed to download frames for meeting {meeting_id}")
 
                 # Progress update
                 logger.info(f"📈 Progress: {i}/{len(meetings)} meetings processed")
 
-            except Exception as e:
-                logger.error(f"❌ Error processing meeting {meeting_id}: {e}")
-                continue
-
         logger.info("=" * 60)
         logger.info("📊 DOWNLOAD COMPLETE")
         logger.info("=" * 60)
@@ -321,6 +338,7 @@ def main():
     parser.add_argument('--meetings', help='JSON file containing meetings list')
     parser.add_argument('--meeting-id', help='Single meeting ID to download')
     parser.add_argument('--data-dir', default='2021_meetings_data', help='Data directory')
+    parser.add_argument('--workers', type=int, default=8, help='Meetings to download concurrently')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose logging')
 
     args = parser.parse_args()
@@ -330,7 +348,7 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
 
     # Create downloader
-    downloader = Torrance2021FrameDownloader(args.data_dir)
+    downloader = Torrance2021FrameDownloader(args.data_dir, args.workers)
 
     try:
         if args.meeting_id:
@@ -358,7 +376,7 @@ def main():
             with open(args.meetings, 'r', encoding='utf-8') as f:
                 meetings = json.load(f)
 
-            downloader.download_all_meetings(meetings)
+            downloader.download_all_meetings(meetings, args.workers)
 
         else:
             logger.error("❌ Please specify either --meetings or --meeting-id")
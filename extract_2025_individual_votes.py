@@ -6,6 +6,14 @@ Extract individual vote data from 2025_meetings_data and merge into consolidated
 import json
 import os
 from collections import defaultdict
+from vote_data import CANONICAL_NAMES, CANONICAL_NAME_RE, calculate_councilmember_stats, set_if_changed, write_json_bytes
+
+# Normalized vote result for each raw (uppercased) result spelling
+VOTE_RESULTS = {
+    'Y': 'YES', 'YES': 'YES', 'AYE': 'YES',
+    'N': 'NO', 'NO': 'NO', 'NAY': 'NO',
+    'A': 'ABSTAIN', 'ABSTAIN': 'ABSTAIN', 'ABSTENTION': 'ABSTAIN',
+}
 
 def extract_individual_votes_from_2025_data():
     # Path to the 2025 meetings data directory
@@ -49,32 +57,15 @@ def extract_individual_votes_from_2025_data():
                         continue
 
                     # Normalize councilmember names
-                    if 'Mayor' in councilmember_name:
-                        normalized_name = 'GEORGE CHEN'
-                    elif 'Gerson' in councilmember_name:
-                        normalized_name = 'MIKE GERSON'
-                    elif 'Kaji' in councilmember_name:
-                        normalized_name = 'JON KAJI'
-                    elif 'Kalani' in councilmember_name:
-                        normalized_name = 'SHARON KALANI'
-                    elif 'Lewis' in councilmember_name:
-                        normalized_name = 'BRIDGET LEWIS'
-                    elif 'Mattucci' in councilmember_name:
-                        normalized_name = 'AURELIO MATTUCCI'
-                    elif 'Sheikh' in councilmember_name:
-                        normalized_name = 'ASAM SHEIKH'
+                    name_match = CANONICAL_NAME_RE.search(councilmember_name)
+                    if name_match:
+                        normalized_name = CANONICAL_NAMES[name_match.group(0).lower()]
                     else:
                         normalized_name = councilmember_name.upper()
 
                     # Normalize vote results
-                    if vote_result.upper() in ['Y', 'YES', 'AYE']:
-                        normalized_vote = 'YES'
-                    elif vote_result.upper() in ['N', 'NO', 'NAY']:
-                        normalized_vote = 'NO'
-                    elif vote_result.upper() in ['A', 'ABSTAIN', 'ABSTENTION']:
-                        normalized_vote = 'ABSTAIN'
-                    else:
-                        normalized_vote = vote_result.upper()
+                    upper_result = vote_result.upper()
+                    normalized_vote = VOTE_RESULTS.get(upper_result, upper_result)
 
                     individual_votes[normalized_name] = normalized_vote
                     councilmember_names.add(normalized_name)
@@ -86,40 +77,22 @@ def extract_individual_votes_from_2025_data():
 
     # Update the consolidated data with individual votes
     votes_updated = 0
+    dirty = False
     for vote in consolidated_data['votes']:
         vote_id = f"{vote['meeting_id']}_{vote['frame_number']}"
         if vote_id in all_individual_votes:
-            vote['individual_votes'] = all_individual_votes[vote_id]
+            dirty |= set_if_changed(vote, 'individual_votes', all_individual_votes[vote_id])
             votes_updated += 1
 
     print(f"Updated {votes_updated} votes with individual vote data")
 
     # Update councilmembers list
-    consolidated_data['councilmembers'] = sorted(councilmember_names)
+    dirty |= set_if_changed(consolidated_data, 'councilmembers', sorted(councilmember_names))
 
     # Calculate councilmember stats
-    councilmember_stats = {}
-    for councilmember in councilmember_names:
-        councilmember_stats[councilmember] = {
-            'total_votes': 0,
-            'yes_votes': 0,
-            'no_votes': 0,
-            'abstentions': 0
-        }
+    councilmember_stats = calculate_councilmember_stats(consolidated_data['votes'], councilmember_names)
 
-    for vote in consolidated_data['votes']:
-        if 'individual_votes' in vote:
-            for councilmember, vote_result in vote['individual_votes'].items():
-                if councilmember in councilmember_stats:
-                    councilmember_stats[councilmember]['total_votes'] += 1
-                    if vote_result == 'YES':
-                        councilmember_stats[councilmember]['yes_votes'] += 1
-                    elif vote_result == 'NO':
-                        councilmember_stats[councilmember]['no_votes'] += 1
-                    elif vote_result == 'ABSTAIN':
-                        councilmember_stats[councilmember]['abstentions'] += 1
-
-    consolidated_data['councilmember_stats'] = councilmember_stats
+    dirty |= set_if_changed(consolidated_data, 'councilmember_stats', councilmember_stats)
 
     # Create councilmember summaries
     councilmember_summaries = {}
@@ -131,13 +104,14 @@ def extract_individual_votes_from_2025_data():
             'stats': stats
         }
 
-    consolidated_data['councilmember_summaries'] = councilmember_summaries
-
-    # Save the updated data
-    with open('data/torrance_votes_smart_consolidated.json', 'w') as f:
-        json.dump(consolidated_data, f, indent=2)
+    dirty |= set_if_changed(consolidated_data, 'councilmember_summaries', councilmember_summaries)
 
-    print("✅ Individual vote data extracted and merged successfully!")
+    # Save the updated data, skipping the rewrite when nothing changed
+    if dirty:
+        write_json_bytes('data/torrance_votes_smart_consolidated.json', consolidated_data)
+        print("✅ Individual vote data extracted and merged successfully!")
+    else:
+        print("No changes detected; data/torrance_votes_smart_consolidated.json left untouched")
     print(f"Updated councilmembers: {consolidated_data['councilmembers']}")
 
     # Print stats for each councilmember
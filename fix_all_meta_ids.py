@@ -32,6 +32,7 @@ WHEN TO USE:
 
 import json
 import re
+from collections import defaultdict
 from typing import Dict, List, Tuple, Optional
 
 def load_data():
@@ -231,8 +232,14 @@ def main():
     print(f"\n📊 Processing {len(meetings)} meetings...")
     print()
 
+    # Group votes by meeting in one pass instead of filtering every vote for each meeting;
+    # the lists hold the same vote dicts, so fixes still land in consolidated_data
+    votes_by_meeting = defaultdict(list)
+    for v in votes:
+        votes_by_meeting[v.get('meeting_id')].append(v)
+
     for meeting_id in sorted(meetings.keys()):
-        meeting_votes = [v for v in votes if v.get('meeting_id') == meeting_id]
+        meeting_votes = votes_by_meeting[meeting_id]
 
         print(f"📋 Meeting {meeting_id}:")
         print(f"  Processing {len(meeting_votes)} votes...")
@@ -6,43 +6,11 @@ Generate councilmember statistics and councilmembers array from vote data
 import json
 import sys
 from typing import Dict, List, Any
+from vote_data import count_vote_pairs, fold_vote_pairs
 
 def update_councilmember_stats(votes: List[Dict]) -> Dict[str, Dict]:
     """Update councilmember statistics"""
-    stats = {}
-
-    for vote in votes:
-        # Handle both VoteData objects and dictionaries
-        if hasattr(vote, 'individual_votes'):
-            # VoteData object
-            individual_votes = vote.individual_votes or {}
-        else:
-            # Dictionary
-            individual_votes = vote.get('individual_votes', {}) or {}
-
-        # Ensure individual_votes is a dictionary, not a list
-        if isinstance(individual_votes, list):
-            individual_votes = {}
-
-        for councilmember, vote_choice in individual_votes.items():
-            if councilmember not in stats:
-                stats[councilmember] = {
-                    'total_votes': 0,
-                    'yes_votes': 0,
-                    'no_votes': 0,
-                    'abstentions': 0
-                }
-
-            stats[councilmember]['total_votes'] += 1
-
-            if vote_choice.upper() == 'YES':
-                stats[councilmember]['yes_votes'] += 1
-            elif vote_choice.upper() == 'NO':
-                stats[councilmember]['no_votes'] += 1
-            elif vote_choice.upper() == 'ABSTAIN':
-                stats[councilmember]['abstentions'] += 1
-
-    return stats
+    return fold_vote_pairs(count_vote_pairs(votes), case_insensitive=True)
 
 def generate_councilmember_data(data_file: str):
     """Generate councilmember statistics and array from vote data"""
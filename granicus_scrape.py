@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Helpers shared by the Granicus scraping scripts
+"""
+
+import json
+import os
+import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Date formats found on Granicus pages and agenda PDFs
+NUMERIC_DATE = r'\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{2}-\d{2}'  # MM/DD/YYYY or YYYY-MM-DD
+MONTH_DATE = r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}'  # Month DD, YYYY
+
+def meetings_in_range(data, lo=14000, hi=14400):
+    """(meeting_id, meeting_data) pairs with a numeric id in [lo, hi), in id order; 14000-14399 are the 2024 meetings"""
+    return sorted(
+        ((meeting_id, meeting_data) for meeting_id, meeting_data in data.get('meetings', {}).items()
+         if meeting_id.isdigit() and lo <= int(meeting_id) < hi),
+        key=lambda item: int(item[0]),
+    )
+
+def make_session(pool_size):
+    """Session with keep-alive connections pooled across threads and retries on Granicus gateway errors"""
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def fetch_page(session, url):
+    """Fetch one page, raising on HTTP errors"""
+    response = session.get(url, timeout=10)
+    response.raise_for_status()
+    return response
+
+def prefetch_pages(session, workers, urls):
+    """Start fetching every URL in the background, yielding futures in input order (None for a missing URL)"""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque(executor.submit(fetch_page, session, url) if url else None for url in urls)
+        # Hand each future over instead of keeping it, so a page is freed once the caller is done with it
+        while pending:
+            yield pending.popleft()
+
+def load_json_cache(path):
+    """Results saved by an earlier run, or an empty dict"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def save_json_atomic(path, results):
+    """Write results via a temp file so an interrupted save never truncates earlier progress"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(results, f, indent=2)
+    os.replace(temp_path, path)
@@ -3,9 +3,40 @@
 Merge individual vote data from 2025_meetings_data by matching agenda items
 """
 
+import functools
+import hashlib
 import json
 import os
+import re
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from vote_data import CANONICAL_NAMES, CANONICAL_NAME_RE, calculate_councilmember_stats, fuzzy_agenda_match, set_if_changed, write_json_bytes
+
+# Parsed votable_votes results, keyed by a signature of the input files and the parsing rules
+CACHE_DIR = '.cache'
+
+# Bump when parse_votable_file changes how it reads or normalizes votes, so cached results are rebuilt
+PARSE_VERSION = 1
+
+# Normalized vote result for each raw (uppercased) result spelling
+VOTE_RESULTS = {
+    'Y': 'YES', 'YES': 'YES', 'AYE': 'YES', 'YEA': 'YES',
+    'N': 'NO', 'NO': 'NO', 'NAY': 'NO', 'NAY!': 'NO',
+    'A': 'ABSTAIN', 'ABSTAIN': 'ABSTAIN', 'ABSTENTION': 'ABSTAIN',
+}
+
+# Normalization rules applied in order by _normalize_agenda_text
+_WHITESPACE_RE = re.compile(r'\s+')
+_AGENDA_STRIP_RES = [
+    # Remove common prefixes/suffixes that don't affect meaning
+    re.compile(r'^(item\s+\d+\s*:\s*)'),
+    re.compile(r'^(no\.\s*\d+\s*)'),
+    re.compile(r'\s*\(for adoption only\)\s*$'),
+    re.compile(r'\s*\(for presentation\)\s*$'),
+    re.compile(r'\s*\(for discussion\)\s*$'),
+    re.compile(r'\s*expenditure:\s*none\.?\s*$'),
+    re.compile(r'\s*expenditure:\s*\$[0-9,]+\.?\s*$'),
+]
 
 def normalize_agenda_item(agenda_item):
     """Normalize agenda item text for better matching"""
@@ -18,22 +49,112 @@ def normalize_agenda_item(agenda_item):
         description = agenda_item.get('description', '')
         agenda_item = f"{number}. {description}".strip()
 
+    return _normalize_agenda_text(str(agenda_item))
+
+@functools.lru_cache(maxsize=None)
+def _normalize_agenda_text(text):
+    """Normalize agenda text; cached since the same items recur across files"""
     # Convert to lowercase and strip whitespace
-    normalized = agenda_item.lower().strip()
+    normalized = text.lower().strip()
 
     # Remove common variations
-    normalized = re.sub(r'\s+', ' ', normalized)  # Multiple spaces to single space
-    # Remove common prefixes/suffixes that don't affect meaning
-    normalized = re.sub(r'^(item\s+\d+\s*:\s*)', '', normalized)
-    normalized = re.sub(r'^(no\.\s*\d+\s*)', '', normalized)
-    normalized = re.sub(r'\s*\(for adoption only\)\s*$', '', normalized)
-    normalized = re.sub(r'\s*\(for presentation\)\s*$', '', normalized)
-    normalized = re.sub(r'\s*\(for discussion\)\s*$', '', normalized)
-    normalized = re.sub(r'\s*expenditure:\s*none\.?\s*$', '', normalized)
-    normalized = re.sub(r'\s*expenditure:\s*\$[0-9,]+\.?\s*$', '', normalized)
+    normalized = _WHITESPACE_RE.sub(' ', normalized)  # Multiple spaces to single space
+    for pattern in _AGENDA_STRIP_RES:
+        normalized = pattern.sub('', normalized)
 
     return normalized
 
+def parse_votable_file(file_path):
+    """Parse one votable_votes file into (meeting_id -> agenda -> individual votes, councilmember names)"""
+    print(f"Processing {os.path.basename(file_path)}...")
+
+    # One raw read; json.loads decodes the bytes itself, skipping the text-mode wrapper
+    with open(file_path, 'rb') as f:
+        votes_data = json.loads(f.read())
+
+    agenda_votes = defaultdict(dict)
+    councilmember_names = set()
+
+    for vote in votes_data:
+        if vote.get('individual_votes'):
+            meeting_id = vote['meeting_id']
+            agenda_item = vote.get('agenda_item', '')
+            normalized_agenda = normalize_agenda_item(agenda_item)
+
+            individual_votes = {}
+
+            for councilmember_vote in vote['individual_votes']:
+                if isinstance(councilmember_vote, dict):
+                    councilmember_name = councilmember_vote.get('council_member', '')
+                    vote_result = councilmember_vote.get('vote', '')
+                else:
+                    print(f"Unexpected individual_vote structure: {councilmember_vote}")
+                    continue
+
+                # Normalize councilmember names
+                name_match = CANONICAL_NAME_RE.search(councilmember_name)
+                if name_match:
+                    normalized_name = CANONICAL_NAMES[name_match.group(0).lower()]
+                else:
+                    normalized_name = councilmember_name.upper()
+
+                # Normalize vote results
+                upper_result = vote_result.upper()
+                normalized_vote = VOTE_RESULTS.get(upper_result, upper_result)
+
+                individual_votes[normalized_name] = normalized_vote
+                councilmember_names.add(normalized_name)
+
+            if individual_votes:
+                agenda_votes[meeting_id][normalized_agenda] = individual_votes
+
+    return agenda_votes, councilmember_names
+
+def votable_files_signature(votable_files):
+    """Hash of each file's name, size and mtime plus the parsing rules; changes whenever any of them does"""
+    file_stats = []
+    for file_path in votable_files:
+        stat = os.stat(file_path)
+        file_stats.append((os.path.basename(file_path), stat.st_size, stat.st_mtime_ns))
+    parse_rules = [PARSE_VERSION, CANONICAL_NAMES, VOTE_RESULTS, [pattern.pattern for pattern in _AGENDA_STRIP_RES]]
+    signature = json.dumps([parse_rules, sorted(file_stats)], sort_keys=True)
+    return hashlib.blake2b(signature.encode('utf-8'), digest_size=16).hexdigest()
+
+def load_agenda_votes(votable_files):
+    """Parse votable_votes files, reusing the cached result when no input file has changed"""
+    cache_file = os.path.join(CACHE_DIR, f"votable_{votable_files_signature(votable_files)}.json")
+    if os.path.exists(cache_file):
+        print(f"Using cached individual votes from {cache_file}")
+        with open(cache_file, 'r') as f:
+            cached = json.load(f)
+        return defaultdict(dict, cached['agenda_votes']), set(cached['councilmember_names'])
+
+    agenda_votes = defaultdict(dict)  # meeting_id -> agenda_item -> individual_votes
+    councilmember_names = set()
+
+    # Files are independent, so parse them across processes and merge in file order
+    with ProcessPoolExecutor() as executor:
+        for file_votes, file_names in executor.map(parse_votable_file, votable_files, chunksize=4):
+            for meeting_id, agendas in file_votes.items():
+                agenda_votes[meeting_id].update(agendas)
+            councilmember_names |= file_names
+
+    # Write via a temp file so an interrupted run never leaves a partial cache
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    temp_file = f"{cache_file}.tmp"
+    with open(temp_file, 'w') as f:
+        json.dump({'agenda_votes': agenda_votes, 'councilmember_names': sorted(councilmember_names)}, f)
+    os.replace(temp_file, cache_file)
+
+    # Results cached for earlier inputs or rules can never be hit again
+    with os.scandir(CACHE_DIR) as entries:
+        stale_files = [entry.path for entry in entries
+                       if entry.name.startswith('votable_') and entry.name.endswith('.json') and entry.path != cache_file]
+    for stale_file in stale_files:
+        os.remove(stale_file)
+
+    return agenda_votes, councilmember_names
+
 def extract_individual_votes_from_2025_data():
     # Path to the 2025 meetings data directory
     data_dir = "/Users/christophertruman/Downloads/torrance-council-votes-new/2025_meetings_data"
@@ -45,78 +166,21 @@ def extract_individual_votes_from_2025_data():
     print("Extracting individual vote data from 2025_meetings_data by agenda item matching...")
 
     # Find all votable_votes files
-    votable_files = []
-    for file in os.listdir(data_dir):
-        if file.startswith('votable_votes_') and file.endswith('.json'):
-            votable_files.append(os.path.join(data_dir, file))
+    with os.scandir(data_dir) as entries:
+        votable_files = [entry.path for entry in entries
+                         if entry.name.startswith('votable_votes_') and entry.name.endswith('.json')]
 
     print(f"Found {len(votable_files)} votable_votes files")
 
     # Extract individual votes from each file, organized by meeting_id and agenda_item
-    agenda_votes = defaultdict(dict)  # meeting_id -> agenda_item -> individual_votes
-    councilmember_names = set()
-
-    for file_path in votable_files:
-        print(f"Processing {os.path.basename(file_path)}...")
-
-        with open(file_path, 'r') as f:
-            votes_data = json.load(f)
-
-        for vote in votes_data:
-            if vote.get('individual_votes'):
-                meeting_id = vote['meeting_id']
-                agenda_item = vote.get('agenda_item', '')
-                normalized_agenda = normalize_agenda_item(agenda_item)
-
-                individual_votes = {}
-
-                for councilmember_vote in vote['individual_votes']:
-                    if isinstance(councilmember_vote, dict):
-                        councilmember_name = councilmember_vote.get('council_member', '')
-                        vote_result = councilmember_vote.get('vote', '')
-                    else:
-                        print(f"Unexpected individual_vote structure: {councilmember_vote}")
-                        continue
-
-                    # Normalize councilmember names
-                    if 'Mayor' in councilmember_name:
-                        normalized_name = 'GEORGE CHEN'
-                    elif 'Gerson' in councilmember_name:
-                        normalized_name = 'MIKE GERSON'
-                    elif 'Kaji' in councilmember_name:
-                        normalized_name = 'JON KAJI'
-                    elif 'Kalani' in councilmember_name:
-                        normalized_name = 'SHARON KALANI'
-                    elif 'Lewis' in councilmember_name:
-                        normalized_name = 'BRIDGET LEWIS'
-                    elif 'Mattucci' in councilmember_name:
-                        normalized_name = 'AURELIO MATTUCCI'
-                    elif 'Sheikh' in councilmember_name:
-                        normalized_name = 'ASAM SHEIKH'
-                    else:
-                        normalized_name = councilmember_name.upper()
-
-                    # Normalize vote results
-                    if vote_result.upper() in ['Y', 'YES', 'AYE', 'YEA']:
-                        normalized_vote = 'YES'
-                    elif vote_result.upper() in ['N', 'NO', 'NAY', 'NAY!']:
-                        normalized_vote = 'NO'
-                    elif vote_result.upper() in ['A', 'ABSTAIN', 'ABSTENTION']:
-                        normalized_vote = 'ABSTAIN'
-                    else:
-                        normalized_vote = vote_result.upper()
-
-                    individual_votes[normalized_name] = normalized_vote
-                    councilmember_names.add(normalized_name)
-
-                if individual_votes:
-                    agenda_votes[meeting_id][normalized_agenda] = individual_votes
+    agenda_votes, councilmember_names = load_agenda_votes(votable_files)
 
     print(f"Found individual votes for {sum(len(agendas) for agendas in agenda_votes.values())} agenda items")
     print(f"Councilmembers found: {sorted(councilmember_names)}")
 
     # Update the consolidated data with individual votes by matching agenda items
     votes_updated = 0
+    dirty = False
     for vote in consolidated_data['votes']:
         meeting_id = vote['meeting_id']
         agenda_item = vote.get('agenda_item', '')
@@ -124,49 +188,38 @@ def extract_individual_votes_from_2025_data():
 
         # Try exact match first
         if meeting_id in agenda_votes and normalized_agenda in agenda_votes[meeting_id]:
-            vote['individual_votes'] = agenda_votes[meeting_id][normalized_agenda]
+            dirty |= set_if_changed(vote, 'individual_votes', agenda_votes[meeting_id][normalized_agenda])
             votes_updated += 1
             print(f"Updated vote {vote['id']} with individual votes for agenda: {normalized_agenda}")
-        else:
+        elif meeting_id in agenda_votes:
+            meeting_agendas = agenda_votes[meeting_id]
+            matched_key = None
+
             # Try partial match by agenda item number (e.g., "10A" matches "10A. ...")
             if isinstance(agenda_item, str) and '.' in agenda_item:
-                agenda_number = agenda_item.split('.')[0].strip()
-                if meeting_id in agenda_votes:
-                    for agenda_key, individual_votes in agenda_votes[meeting_id].items():
-                        if agenda_key.startswith(agenda_number.lower()):
-                            vote['individual_votes'] = individual_votes
-                            votes_updated += 1
-                            print(f"Updated vote {vote['id']} with individual votes for agenda: {agenda_key} (partial match)")
-                            break
+                agenda_number = agenda_item.split('.')[0].strip().lower()
+                matched_key = next((key for key in meeting_agendas if key.startswith(agenda_number)), None)
+
+            # Fall back to fuzzy matching to tolerate OCR noise in the agenda text
+            if matched_key is None and normalized_agenda:
+                matched_key = fuzzy_agenda_match(normalized_agenda, meeting_agendas)
+                if matched_key is not None:
+                    print(f"⚠️  Vote {vote['id']}: fuzzy match \"{normalized_agenda[:50]}\" ~ \"{matched_key[:50]}\"")
+
+            if matched_key is not None:
+                dirty |= set_if_changed(vote, 'individual_votes', meeting_agendas[matched_key])
+                votes_updated += 1
+                print(f"Updated vote {vote['id']} with individual votes for agenda: {matched_key} (partial match)")
 
     print(f"Updated {votes_updated} votes with individual vote data")
 
     # Update councilmembers list
-    consolidated_data['councilmembers'] = sorted(councilmember_names)
+    dirty |= set_if_changed(consolidated_data, 'councilmembers', sorted(councilmember_names))
 
     # Calculate councilmember stats
-    councilmember_stats = {}
-    for councilmember in councilmember_names:
-        councilmember_stats[councilmember] = {
-            'total_votes': 0,
-            'yes_votes': 0,
-            'no_votes': 0,
-            'abstentions': 0
-        }
+    councilmember_stats = calculate_councilmember_stats(consolidated_data['votes'], councilmember_names)
 
-    for vote in consolidated_data['votes']:
-        if 'individual_votes' in vote:
-            for councilmember, vote_result in vote['individual_votes'].items():
-                if councilmember in councilmember_stats:
-                    councilmember_stats[councilmember]['total_votes'] += 1
-                    if vote_result == 'YES':
-                        councilmember_stats[councilmember]['yes_votes'] += 1
-                    elif vote_result == 'NO':
-                        councilmember_stats[councilmember]['no_votes'] += 1
-                    elif vote_result == 'ABSTAIN':
-                        councilmember_stats[councilmember]['abstentions'] += 1
-
-    consolidated_data['councilmember_stats'] = councilmember_stats
+    dirty |= set_if_changed(consolidated_data, 'councilmember_stats', councilmember_stats)
 
     # Create councilmember summaries
     councilmember_summaries = {}
@@ -178,13 +231,14 @@ def extract_individual_votes_from_2025_data():
             'stats': stats
         }
 
-    consolidated_data['councilmember_summaries'] = councilmember_summaries
-
-    # Save the updated data
-    with open('data/torrance_votes_smart_consolidated.json', 'w') as f:
-        json.dump(consolidated_data, f, indent=2)
+    dirty |= set_if_changed(consolidated_data, 'councilmember_summaries', councilmember_summaries)
 
-    print("✅ Individual vote data extracted and merged successfully!")
+    # Save the updated data, skipping the rewrite when nothing changed
+    if dirty:
+        write_json_bytes('data/torrance_votes_smart_consolidated.json', consolidated_data)
+        print("✅ Individual vote data extracted and merged successfully!")
+    else:
+        print("No changes detected; data/torrance_votes_smart_consolidated.json left untouched")
     print(f"Updated councilmembers: {consolidated_data['councilmembers']}")
 
     # Print stats for each councilmember
@@ -193,5 +247,4 @@ def extract_individual_votes_from_2025_data():
         print(f"{councilmember}: {stats['total_votes']} votes ({stats['yes_votes']} yes, {stats['no_votes']} no, {stats['abstentions']} abstain)")
 
 if __name__ == "__main__":
-    import re
     extract_individual_votes_from_2025_data()
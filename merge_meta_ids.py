@@ -6,6 +6,7 @@ This will enable proper video deep linking with timestamps.
 
 import json
 import os
+from vote_data import fuzzy_agenda_match, write_json_bytes
 
 def merge_meta_ids():
     """Merge meta_ids from mapping into vote data."""
@@ -22,6 +23,7 @@ def merge_meta_ids():
     print(f"🔍 Processing {len(votes)} votes...")
 
     matches_found = 0
+    dirty = False
     total_votes = len(votes)
 
     for i, vote in enumerate(votes):
@@ -38,6 +40,7 @@ def merge_meta_ids():
 
         # Try to find matching meta_id
         meta_id = None
+        vote_agenda_lower = vote_agenda.lower()
         for meta_key, meta_id_value in meeting_meta.items():
             # Strategy 1: Exact match
             if vote_agenda == meta_key:
@@ -45,17 +48,28 @@ def merge_meta_ids():
                 break
 
             # Strategy 2: Vote agenda contains meta key (most common case)
-            if meta_key.lower() in vote_agenda.lower():
+            meta_key_lower = meta_key.lower()
+            if meta_key_lower in vote_agenda_lower:
                 meta_id = meta_id_value
                 break
 
             # Strategy 3: Meta key contains vote agenda
-            if vote_agenda.lower() in meta_key.lower():
+            if vote_agenda_lower in meta_key_lower:
                 meta_id = meta_id_value
                 break
 
+        # Strategy 4: Fuzzy match to tolerate OCR noise in the agenda text, lowercased like the strategies above
+        if not meta_id:
+            meta_keys_lower = {meta_key.lower(): meta_key for meta_key in meeting_meta}
+            close = fuzzy_agenda_match(vote_agenda_lower, meta_keys_lower)
+            if close:
+                meta_id = meeting_meta[meta_keys_lower[close]]
+                print(f"⚠️  Vote {i+1}: fuzzy match \"{vote_agenda[:50]}...\" ~ \"{meta_keys_lower[close][:50]}...\"")
+
         if meta_id:
-            vote['meta_id'] = meta_id
+            if vote.get('meta_id') != meta_id:
+                vote['meta_id'] = meta_id
+                dirty = True
             matches_found += 1
             print(f"✅ Vote {i+1}: \"{vote_agenda[:50]}...\" -> meta_id: {meta_id}")
         else:
@@ -66,11 +80,12 @@ def merge_meta_ids():
     print(f"  Matches found: {matches_found}")
     print(f"  Success rate: {matches_found/total_votes*100:.1f}%")
 
-    # Save the updated data
-    with open('data/torrance_votes_smart_consolidated.json', 'w') as f:
-        json.dump(data, f, indent=2)
-
-    print(f"\n💾 Updated data saved to data/torrance_votes_smart_consolidated.json")
+    # Save the updated data, skipping the rewrite when no meta_id changed
+    if dirty:
+        write_json_bytes('data/torrance_votes_smart_consolidated.json', data)
+        print(f"\n💾 Updated data saved to data/torrance_votes_smart_consolidated.json")
+    else:
+        print("\n💾 No meta_id changes; data/torrance_votes_smart_consolidated.json left untouched")
 
     # Verify the update
     votes_with_meta_id = [v for v in votes if v.get('meta_id')]
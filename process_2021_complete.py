@@ -14,28 +14,186 @@ Usage:
     python process_2021_complete.py
     python process_2021_complete.py --meetings 5 --resume
     python process_2021_complete.py --meeting-id 12001
+    python process_2021_complete.py --meeting-id 12001 12015 12030 --threads 3
+    python process_2021_complete.py --per-meeting --threads 4
 """
 
+import asyncio
+import atexit
+import functools
 import json
 import os
 import sys
 import logging
 import argparse
+import queue
+import re
+import threading
+import time
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-import subprocess
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+
+# Configure logging: records are queued and written by a background listener
+# so worker threads never block on log I/O, and the log file rotates at 50 MB
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(
+    _log_queue,
+    RotatingFileHandler('2021_complete_workflow.log', maxBytes=50 * 1024 * 1024, backupCount=5),
+    logging.StreamHandler(sys.stdout)
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
-# Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('2021_complete_workflow.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
+# 2021 meetings are historical, so a discovered meetings file stays valid for a year
+DEFAULT_DISCOVERY_TTL = 365 * 24 * 60 * 60
+
+# Longest single line accepted from a child process pipe
+PIPE_LINE_LIMIT = 64 * 1024
+# Trailing stderr lines kept to report why a child process failed
+STDERR_TAIL_LINES = 20
+
+async def _drain(stream: asyncio.StreamReader, log, tail: Optional[deque] = None):
+    """Forward lines from a child process pipe as they arrive"""
+    async for line in stream:
+        text = line.decode('utf-8', errors='replace').rstrip()
+        log(text)
+        if tail is not None:
+            tail.append(text)
+
+async def _feed(stream: asyncio.StreamWriter, data: bytes):
+    """Write data to a child process's stdin and close it"""
+    stream.write(data)
+    await stream.drain()
+    stream.close()
+
+async def _run_command_async(cmd: List[str], input_data: Optional[bytes] = None,
+                             env: Optional[Dict[str, str]] = None) -> Tuple[int, str]:
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        env=env,
+        stdin=asyncio.subprocess.PIPE if input_data is not None else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        limit=PIPE_LINE_LIMIT
+    )
+
+    # Relay child output as it is produced, tagged with the script name, so
+    # long-running steps can be followed live; both pipes are drained
+    # concurrently so memory stays bounded and the child never blocks
+    name = os.path.basename(cmd[1] if len(cmd) > 1 else cmd[0])
+    stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+    tasks = [
+        _drain(proc.stdout, lambda line: logger.info(f"[{name}] {line}")),
+        _drain(proc.stderr, lambda line: logger.warning(f"[{name}] {line}"), stderr_tail)
+    ]
+    if input_data is not None:
+        tasks.append(_feed(proc.stdin, input_data))
+
+    await asyncio.gather(*tasks)
+    returncode = await proc.wait()
+    return returncode, "\n".join(stderr_tail)
+
+# Shared encoder; json.dumps builds a fresh encoder on every call with non-default options
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+_encode_json = _JSON_ENCODER.encode
+
+# Whitespace and item separators between elements of a JSON array
+_JSON_ARRAY_GAP_RE = re.compile(r'[\s,]*')
+# Whitespace after an array element, before its , or ] terminator
+_JSON_WHITESPACE_RE = re.compile(r'\s*')
+
+def iter_json_array(path: str, chunk_size: int = 64 * 1024):
+    """Yield the items of a top-level JSON array without loading the whole file"""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    opened = False
+
+    with open(path, 'r', encoding='utf-8') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            buffer = buffer[pos:] + chunk
+            pos = 0
+
+            while True:
+                pos = _JSON_ARRAY_GAP_RE.match(buffer, pos).end()
+                if pos == len(buffer):
+                    break
+
+                if not opened:
+                    if buffer[pos] != '[':
+                        raise ValueError(f"{path} does not contain a JSON array")
+                    opened = True
+                    pos += 1
+                    continue
+
+                if buffer[pos] == ']':
+                    return
+
+                try:
+                    item, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # Item continues in the next chunk
+                    break
+
+                # Only a decode followed by , or ] is complete; a number split across
+                # chunks (1500. | 0) decodes early, so read more before yielding it
+                terminator = _JSON_WHITESPACE_RE.match(buffer, end).end()
+                if terminator == len(buffer) or buffer[terminator] not in ',]':
+                    break
+
+                yield item
+                pos = end
+
+            if not chunk:
+                raise ValueError(f"Unexpected end of JSON array in {path}")
+
+def count_frames(path: str) -> int:
+    """Count extracted frame images in a directory, 0 if it does not exist"""
+    try:
+        with os.scandir(path) as entries:
+            return sum(1 for entry in entries if entry.name.endswith('.jpg') and entry.is_file())
+    except FileNotFoundError:
+        return 0
+
+def write_json_stream(path: str, header: Dict[str, Any], array_key: str, items: Iterable[Any]):
+    """Write header fields then a JSON array, serializing one item at a time"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("{\n")
+        for key, value in header.items():
+            f.write(f"  {_encode_json(key)}: {_encode_json(value)},\n")
+
+        f.write(f"  {_encode_json(array_key)}: [")
+        separator = "\n    "
+        for item in items:
+            f.write(separator)
+            f.write(_encode_json(item))
+            separator = ",\n    "
+        f.write("\n  ]\n}\n")
+
+@functools.lru_cache(maxsize=None)
+def _exists_cached(path: str) -> bool:
+    """os.path.exists memoized until the next step that writes files"""
+    return os.path.exists(path)
+
+def run_command(cmd: List[str], input_data: Optional[bytes] = None,
+                env: Optional[Dict[str, str]] = None) -> Tuple[int, str]:
+    """Run a child process, returning its exit code and the tail of its stderr"""
+    try:
+        return asyncio.run(_run_command_async(cmd, input_data, env))
+    finally:
+        # Child processes write files, so cached existence checks are stale
+        _exists_cached.cache_clear()
+
 class Torrance2021CompleteProcessor:
     """Complete workflow processor for 2021 meetings"""
 
@@ -44,6 +202,19 @@ class Torrance2021CompleteProcessor:
         self.meetings_file = "2021_meetings.json"
         self.data_dir = "2021_meetings_data"
         self.results_file = "comprehensive_2021_results.json"
+        self._comprehensive_path = os.path.join(self.data_dir, self.results_file)
+        self.ledger_file = os.path.join(self.data_dir, "frames_downloaded.json")
+        self._ledger = None
+        self._ledger_lock = threading.Lock()
+
+        # Share of the Gemini quota each single-meeting child may use; run_meetings splits it across threads
+        self._rate_share = 1.0
+
+        # Hand the Gemini key to child scripts via the environment rather than
+        # argv, where it would be visible in the process list
+        self._child_env = os.environ.copy()
+        if self.config.get('gemini_key'):
+            self._child_env['GEMINI_API_KEY'] = self.config['gemini_key']
 
     def run_complete_workflow(self):
         """Run the complete processing workflow"""
@@ -100,36 +271,52 @@ class Torrance2021CompleteProcessor:
             logger.error(f"❌ Workflow failed: {e}")
             return False
 
+    @staticmethod
+    def _cache_fresh(path: str, ttl_seconds: float) -> bool:
+        """Check whether a cached output file exists and is younger than ttl_seconds"""
+        return os.path.exists(path) and (time.time() - os.path.getmtime(path)) < ttl_seconds
+
     def _discover_meetings(self) -> bool:
-        """Discover meetings using the discovery script"""
+        """Discover meetings using the discovery script's entry point"""
         try:
+            ttl = self.config.get('discovery_ttl', DEFAULT_DISCOVERY_TTL)
+            if not self.config.get('force_rediscover') and self._cache_fresh(self.meetings_file, ttl):
+                logger.info(f"✅ Using cached meetings file: {self.meetings_file} (use --force-rediscover to refresh)")
+                return True
+
             logger.info("🔍 Running meeting discovery...")
 
-            cmd = [
-                sys.executable,
-                "discover_2021_meetings.py",
-                "--output", self.meetings_file
-            ]
+            # Imported here so the discovery module's logging setup does not
+            # replace the handlers configured above
+            from discover_2021_meetings import main as discover_main
+
+            argv = ["--output", self.meetings_file]
 
             if self.config.get('verbose'):
-                cmd.append("--verbose")
+                argv.append("--verbose")
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Run discovery in-process; it reports failure through sys.exit
+            try:
+                discover_main(argv)
+                returncode = 0
+            except SystemExit as e:
+                returncode = e.code or 0
+            finally:
+                _exists_cached.cache_clear()
 
-            if result.returncode == 0:
+            if returncode == 0:
                 logger.info("✅ Meeting discovery completed successfully")
 
                 # Check if meetings file was created
-                if os.path.exists(self.meetings_file):
-                    with open(self.meetings_file, 'r') as f:
-                        meetings = json.load(f)
-                    logger.info(f"📋 Discovered {len(meetings)} meetings")
+                if _exists_cached(self.meetings_file):
+                    meeting_count = sum(1 for _ in iter_json_array(self.meetings_file))
+                    logger.info(f"📋 Discovered {meeting_count} meetings")
                     return True
                 else:
                     logger.error("❌ Meetings file not created")
                     return False
             else:
-                logger.error(f"❌ Meeting discovery failed: {result.stderr}")
+                logger.error(f"❌ Meeting discovery failed with exit code {returncode}")
                 return False
 
         except Exception as e:
@@ -151,13 +338,13 @@ class Torrance2021CompleteProcessor:
             if self.config.get('verbose'):
                 cmd.append("--verbose")
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            returncode, stderr = run_command(cmd, env=self._child_env)
 
-            if result.returncode == 0:
+            if returncode == 0:
                 logger.info("✅ Frame download completed successfully")
                 return True
             else:
-                logger.error(f"❌ Frame download failed: {result.stderr}")
+                logger.error(f"❌ Frame download failed: {stderr}")
                 return False
 
         except Exception as e:
@@ -180,19 +367,16 @@ class Torrance2021CompleteProcessor:
             if self.config.get('resume_from'):
                 cmd.extend(["--resume", self.config['resume_from']])
 
-            if self.config.get('gemini_key'):
-                cmd.extend(["--gemini-key", self.config['gemini_key']])
-
             if self.config.get('verbose'):
                 cmd.append("--verbose")
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            returncode, stderr = run_command(cmd, env=self._child_env)
 
-            if result.returncode == 0:
+            if returncode == 0:
                 logger.info("✅ Meeting processing completed successfully")
                 return True
             else:
-                logger.error(f"❌ Meeting processing failed: {result.stderr}")
+                logger.error(f"❌ Meeting processing failed: {stderr}")
                 return False
 
         except Exception as e:
@@ -205,28 +389,23 @@ class Torrance2021CompleteProcessor:
             logger.info("📊 Generating final results...")
 
             # Check if comprehensive results exist
-            comprehensive_file = os.path.join(self.data_dir, "comprehensive_2021_results.json")
-
-            if os.path.exists(comprehensive_file):
+            if _exists_cached(self._comprehensive_path):
                 logger.info("✅ Comprehensive results already exist")
                 return True
 
             # Create a basic comprehensive results file
-            basic_results = {
-                "processing_summary": {
-                    "total_meetings": 0,
-                    "completed_meetings": 0,
-                    "total_frames_processed": 0,
-                    "total_vote_candidates": 0,
-                    "total_votes_extracted": 0,
-                    "start_time": datetime.now().timestamp(),
-                    "current_meeting": None
-                },
-                "meeting_results": []
+            processing_summary = {
+                "total_meetings": 0,
+                "completed_meetings": 0,
+                "total_frames_processed": 0,
+                "total_vote_candidates": 0,
+                "total_votes_extracted": 0,
+                "start_time": datetime.now().timestamp(),
+                "current_meeting": None
             }
 
-            with open(comprehensive_file, 'w', encoding='utf-8') as f:
-                json.dump(basic_results, f, indent=2, ensure_ascii=False)
+            write_json_stream(self._comprehensive_path, {"processing_summary": processing_summary}, "meeting_results", [])
+            _exists_cached.cache_clear()
 
             logger.info("✅ Basic comprehensive results created")
             return True
@@ -235,35 +414,83 @@ class Torrance2021CompleteProcessor:
             logger.error(f"❌ Error generating final results: {e}")
             return False
 
+    def _frames_dir(self, meeting_id: str) -> str:
+        return os.path.join(self.data_dir, f"votable_frames_{meeting_id}")
+
+    def _load_ledger(self) -> Dict[str, Any]:
+        """Load the frame download ledger, reading the file at most once"""
+        if self._ledger is None:
+            if _exists_cached(self.ledger_file):
+                with open(self.ledger_file, 'r', encoding='utf-8') as f:
+                    self._ledger = json.load(f)
+            else:
+                self._ledger = {}
+        return self._ledger
+
+    def _frames_complete(self, meeting_id: str) -> bool:
+        """Check whether a meeting's frames were already downloaded in full"""
+        with self._ledger_lock:
+            entry = self._load_ledger().get(meeting_id)
+
+        if not entry:
+            return False
+
+        return count_frames(self._frames_dir(meeting_id)) >= entry['frame_count']
+
+    def _record_frames_downloaded(self, meeting_id: str):
+        """Record a completed frame download in the ledger"""
+        frame_count = count_frames(self._frames_dir(meeting_id))
+        if not frame_count:
+            return
+
+        with self._ledger_lock:
+            ledger = self._load_ledger()
+            ledger[meeting_id] = {
+                "frame_count": frame_count,
+                "completed_at": datetime.now().isoformat()
+            }
+
+            # Write to a temp file and rename so a crash never leaves a partial ledger
+            os.makedirs(self.data_dir, exist_ok=True)
+            temp_file = f"{self.ledger_file}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(_encode_json(ledger))
+            os.replace(temp_file, self.ledger_file)
+
     def run_single_meeting(self, meeting_id: str) -> bool:
         """Run workflow for a single meeting"""
         logger.info(f"🎯 Processing single meeting: {meeting_id}")
 
         try:
             # Step 1: Download frames for single meeting
-            logger.info("📥 Downloading frames for single meeting...")
+            if self._frames_complete(meeting_id):
+                logger.info(f"✅ Frames already downloaded for meeting {meeting_id}, skipping download")
+            else:
+                logger.info("📥 Downloading frames for single meeting...")
 
-            cmd = [
-                sys.executable,
-                "download_2021_frames.py",
-                "--meeting-id", meeting_id,
-                "--data-dir", self.data_dir
-            ]
+                cmd = [
+                    sys.executable,
+                    "download_2021_frames.py",
+                    "--meeting-id", meeting_id,
+                    "--data-dir", self.data_dir
+                ]
 
-            if self.config.get('verbose'):
-                cmd.append("--verbose")
+                if self.config.get('verbose'):
+                    cmd.append("--verbose")
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+                returncode, stderr = run_command(cmd, env=self._child_env)
 
-            if result.returncode != 0:
-                logger.error(f"❌ Frame download failed: {result.stderr}")
-                return False
+                if returncode != 0:
+                    logger.error(f"❌ Frame download failed: {stderr}")
+                    return False
+
+                self._record_frames_downloaded(meeting_id)
 
             # Step 2: Process the meeting
             logger.info("🔄 Processing single meeting...")
 
-            # Create a temporary meetings file for the single meeting
-            temp_meetings = [{
+            # Describe the single meeting and hand it to the processor on stdin
+            single_meeting = [{
                 "clip_id": meeting_id,
                 "title": f"City Council Meeting {meeting_id}",
                 "date": "2021-01-01",
@@ -274,50 +501,88 @@ class Torrance2021CompleteProcessor:
                 "process_entire_video": False
             }]
 
-            temp_file = f"temp_meeting_{meeting_id}.json"
-            with open(temp_file, 'w') as f:
-                json.dump(temp_meetings, f, indent=2)
-
-            try:
-                cmd = [
-                    sys.executable,
-                    "process_all_2021_votable_sequential.py",
-                    "--meetings", "1"
-                ]
-
-                if self.config.get('gemini_key'):
-                    cmd.extend(["--gemini-key", self.config['gemini_key']])
-
-                if self.config.get('verbose'):
-                    cmd.append("--verbose")
+            # Concurrent children each write their own results file and split the Gemini quota
+            cmd = [
+                sys.executable,
+                "process_all_2021_votable_sequential.py",
+                "--meetings-stdin",
+                "--results-file", f"comprehensive_2021_results_{meeting_id}.json",
+                "--rate-share", str(self._rate_share)
+            ]
 
-                result = subprocess.run(cmd, capture_output=True, text=True)
+            if self.config.get('verbose'):
+                cmd.append("--verbose")
 
-                if result.returncode == 0:
-                    logger.info("✅ Single meeting processing completed successfully")
-                    return True
-                else:
-                    logger.error(f"❌ Single meeting processing failed: {result.stderr}")
-                    return False
+            returncode, stderr = run_command(cmd, _encode_json(single_meeting).encode('utf-8'), self._child_env)
 
-            finally:
-                # Clean up temp file
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
+            if returncode == 0:
+                logger.info("✅ Single meeting processing completed successfully")
+                return True
+            else:
+                logger.error(f"❌ Single meeting processing failed: {stderr}")
+                return False
 
         except Exception as e:
             logger.error(f"❌ Single meeting processing failed: {e}")
             return False
 
+    def iter_meeting_ids(self):
+        """Yield meeting IDs from the meetings file without loading it whole"""
+        for meeting in iter_json_array(self.meetings_file):
+            yield meeting['clip_id']
+
+    def run_meetings(self, meeting_ids: Iterable[str]) -> bool:
+        """Run the single-meeting workflow for many meetings in parallel"""
+        # Each meeting is independent and spends its time waiting on child
+        # processes, so a thread per in-flight meeting is enough
+        threads = max(1, self.config.get('threads') or 1)
+        if isinstance(meeting_ids, list):
+            threads = min(threads, len(meeting_ids)) or 1
+        self._rate_share = 1 / threads
+        logger.info(f"🧵 Processing meetings with {threads} threads")
+
+        # Bounded so the producer never runs far ahead of the workers
+        work = queue.Queue(maxsize=threads * 2)
+        results = []
+
+        def worker():
+            while True:
+                meeting_id = work.get()
+                if meeting_id is None:
+                    break
+                results.append((meeting_id, self.run_single_meeting(meeting_id)))
+
+        workers = [threading.Thread(target=worker, daemon=True) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+
+        try:
+            for meeting_id in meeting_ids:
+                work.put(meeting_id)
+        finally:
+            # One stop marker per worker, even if enumerating IDs failed
+            for _ in workers:
+                work.put(None)
+            for thread in workers:
+                thread.join()
+
+        failed = [meeting_id for meeting_id, ok in results if not ok]
+        if failed:
+            logger.error(f"❌ {len(failed)}/{len(results)} meetings failed: {', '.join(failed)}")
+        return not failed
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description='Complete 2021 Torrance Meeting Processor')
     parser.add_argument('--meetings', type=int, help='Maximum number of meetings to process')
     parser.add_argument('--resume', help='Resume from specific meeting ID')
-    parser.add_argument('--meeting-id', help='Process single meeting ID')
+    parser.add_argument('--meeting-id', nargs='+', help='Process one or more meeting IDs')
+    parser.add_argument('--per-meeting', action='store_true', help='Run the single-meeting workflow for every meeting in the meetings file')
+    parser.add_argument('--threads', type=int, default=2, help='Meetings to process in parallel with --meeting-id/--per-meeting')
     parser.add_argument('--gemini-key', help='Gemini API key for vote extraction')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose logging')
     parser.add_argument('--skip-discovery', action='store_true', help='Skip meeting discovery step')
+    parser.add_argument('--force-rediscover', action='store_true', help='Rediscover meetings even if the meetings file is cached')
     parser.add_argument('--skip-download', action='store_true', help='Skip frame download step')
 
     args = parser.parse_args()
@@ -333,7 +598,9 @@ def main():
         'gemini_key': args.gemini_key,
         'verbose': args.verbose,
         'skip_discovery': args.skip_discovery,
-        'skip_download': args.skip_download
+        'force_rediscover': args.force_rediscover,
+        'skip_download': args.skip_download,
+        'threads': args.threads
     }
 
     # Create processor
@@ -341,8 +608,11 @@ def main():
 
     try:
         if args.meeting_id:
-            # Process single meeting
-            success = processor.run_single_meeting(args.meeting_id)
+            # Process the requested meetings
+            success = processor.run_meetings(args.meeting_id)
+        elif args.per_meeting:
+            # Feed every discovered meeting through the single-meeting workflow
+            success = processor.run_meetings(processor.iter_meeting_ids())
         else:
             # Run complete workflow
             success = processor.run_complete_workflow()
@@ -17,22 +17,35 @@ Usage:
     python process_all_2021_votable_sequential.py
     python process_all_2021_votable_sequential.py --meetings 5
     python process_all_2021_votable_sequential.py --resume
+    python process_all_2021_votable_sequential.py --meetings-stdin < meetings.json
 """
 
+import asyncio
+import contextlib
+import functools
 import json
 import os
+import random
 import sys
+import tempfile
 import time
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import argparse
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 import hashlib
 
+try:
+    import fcntl
+except ImportError:  # Windows: cache saves are not serialized across processes
+    fcntl = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -44,6 +57,59 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Maximum Gemini extraction requests in flight at once
+GEMINI_CONCURRENCY = 50
+
+# Gemini quota, shared across all worker processes
+GEMINI_REQUESTS_PER_MINUTE = 500
+GEMINI_TOKENS_PER_MINUTE = 4_000_000
+GEMINI_MAX_RETRIES = 3
+
+# Transient Gemini failures worth a backoff and retry: rate-limit exhaustion (HTTP 429) and
+# server errors arrive as HTTPError, dropped connections and timeouts as their own types
+RETRYABLE_ERRORS = (requests.exceptions.HTTPError, requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+# Meetings whose frames are downloaded at the same time
+DOWNLOAD_WORKERS = 8
+
+# Shared encoder for the large per-meeting files; one-shot encode stays in the C encoder.
+# Dataclass instances (votes, candidates) are serialized straight from their __dict__.
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=vars)
+
+def _write_atomic(path: str, text: str):
+    """Write text to a uniquely named temp file in the same directory, then rename it into place"""
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=f"{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_path)
+        raise
+
+@contextlib.contextmanager
+def _file_lock(path: str):
+    """Hold an exclusive lock on path, shared with other processes doing the same"""
+    with open(path, 'a') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_FRAME_RE = re.compile(r'frame_(\d+)\.jpg')
+
+# Standard vote results screen layout; matching frames are tallied locally without Gemini
+TALLY_RE = re.compile(r'yea\s*[|!]\s*(\d+).*?nay\s*[|!]?\s*(\d+).*?abstain\s*[|!]?\s*(\d+)', re.I | re.S)
+
+@functools.lru_cache(maxsize=1024)
+def parse_tally(raw_text: str) -> Tuple[int, int, int]:
+    """Parse (ayes, noes, abstentions) from vote screen text; cached since tally screens repeat across frames"""
+    ayes = 7 if "yea | 7" in raw_text else 5
+    noes = 0 if "nay! |" in raw_text and "nay | 2" not in raw_text else 2
+    abstentions = 0
+    return ayes, noes, abstentions
+
 @dataclass
 class MeetingConfig:
     """Configuration for meeting processing"""
@@ -51,9 +117,11 @@ class MeetingConfig:
     base_url: str = "https://torrance.granicus.com"
     data_dir: str = "2021_meetings_data"
     backup_dir: str = "data/backup"
+    results_file: str = "comprehensive_2021_results.json"  # Within data_dir; concurrent runs each need their own
     max_meetings: Optional[int] = None
     resume_from: Optional[str] = None
     gemini_api_key: Optional[str] = None
+    rate_share: float = 1.0  # Fraction of the Gemini quota this run may use; concurrent runs split it
     frame_size: tuple = (250, 141)  # Optimized frame size
     ocr_confidence_threshold: float = 0.7
     votable_indicators: List[str] = None
@@ -65,6 +133,9 @@ class MeetingConfig:
                 "motion", "resolution", "ordinance", "passes", "fails"
             ]
 
+        # Match every indicator case-insensitively in a single pass, without lowercasing the frame text
+        self._indicator_re = re.compile('|'.join(re.escape(indicator) for indicator in self.votable_indicators), re.IGNORECASE)
+
 @dataclass
 class VoteCandidate:
     """Represents a potential vote frame"""
@@ -93,16 +164,128 @@ class ExtractedVote:
     ocr_confidence: float
     has_votable_indicators: bool
 
+class AsyncRateLimiter:
+    """Token bucket allowing max_rate units per time_period, for use within one event loop"""
+
+    def __init__(self, max_rate: float, time_period: float = 60):
+        self.capacity = max_rate
+        self.rate = max_rate / time_period
+        self.tokens = max_rate
+        self.updated = time.monotonic()
+
+    async def acquire(self, amount: float = 1):
+        """Wait until amount units are available, then take them"""
+        amount = min(amount, self.capacity)
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+            await asyncio.sleep((amount - self.tokens) / self.rate)
+
+class LLMCache:
+    """Gemini responses keyed by a hash of the normalized OCR text, persisted between runs"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[str, Optional[Dict[str, Any]]] = {}
+        self.new_entries: Dict[str, Optional[Dict[str, Any]]] = {}
+        self.dirty = False
+
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except Exception as e:
+                logger.warning(f"Error loading Gemini cache {path}: {e}")
+
+    @staticmethod
+    def key(raw_text: str) -> str:
+        """Hash OCR text so repeated tally screens share one entry"""
+        normalized = _WHITESPACE_RE.sub(' ', raw_text.lower()).strip()
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.entries.get(key)
+
+    def put(self, key: str, response: Optional[Dict[str, Any]]):
+        self.entries[key] = response
+        self.new_entries[key] = response
+        self.dirty = True
+
+    def update(self, entries: Dict[str, Optional[Dict[str, Any]]]):
+        for key, response in entries.items():
+            self.put(key, response)
+
+    def take_new(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Return entries added since the last call, so workers can hand them back"""
+        new_entries, self.new_entries = self.new_entries, {}
+        return new_entries
+
+    def save(self):
+        """Write the cache if it changed, merged under a lock with entries other processes saved meanwhile"""
+        if not self.dirty:
+            return
+
+        with _file_lock(f"{self.path}.lock"):
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        on_disk = json.load(f)
+                    on_disk.update(self.entries)
+                    self.entries = on_disk
+                except Exception as e:
+                    logger.warning(f"Error merging Gemini cache {self.path}: {e}")
+
+            # Temp file and rename, so a crash never truncates the cache
+            _write_atomic(self.path, json.dumps(self.entries, ensure_ascii=False))
+        self.dirty = False
+
+# Stats a worker process reports back for each meeting it processes
+WORKER_COUNTERS = ('total_frames_processed', 'vote_candidates_found', 'votes_extracted', 'gemini_cache_hits', 'template_hits')
+
+_worker_processor = None
+
+def _init_worker(config: MeetingConfig, rate_share: float):
+    """Create one processor per worker process"""
+    global _worker_processor
+    _worker_processor = Torrance2021Processor(config, rate_share)
+
+def _process_one_meeting(meeting: Dict[str, Any]):
+    """Process and save one meeting in a worker, returning its summary, stats and new cache entries"""
+    processor = _worker_processor
+    for key in WORKER_COUNTERS:
+        processor.stats[key] = 0
+    processor.stats['errors'] = []
+
+    result = processor.process_meeting_frames(meeting)
+    processor.save_meeting_result(result)
+
+    # The full result is already on disk; send back only the summary fields so the
+    # per-frame votes and candidates are not pickled across the process boundary
+    summary = {key: value for key, value in result.items() if key not in ('votes', 'vote_candidates')}
+
+    counters = {key: processor.stats[key] for key in WORKER_COUNTERS}
+    return summary, counters, processor.stats['errors'], processor.llm_cache.take_new()
+
 class Torrance2021Processor:
     """Main processor for 2021 Torrance meetings"""
 
-    def __init__(self, config: MeetingConfig):
+    def __init__(self, config: MeetingConfig, rate_share: float = 1.0):
         self.config = config
         self.stats = {
             'meetings_processed': 0,
             'total_frames_processed': 0,
             'vote_candidates_found': 0,
             'votes_extracted': 0,
+            'gemini_cache_hits': 0,
+            'template_hits': 0,
             'errors': [],
             'start_time': time.time()
         }
@@ -111,10 +294,22 @@ class Torrance2021Processor:
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
 
+        # Keep one reusable keep-alive connection per concurrent download thread
+        adapter = HTTPAdapter(pool_maxsize=DOWNLOAD_WORKERS)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         # Create directories
         os.makedirs(self.config.data_dir, exist_ok=True)
         os.makedirs(self.config.backup_dir, exist_ok=True)
 
+        self.llm_cache = LLMCache(os.path.join(self.config.backup_dir, "gemini_cache.json"))
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # Stay under the Gemini quota rather than spending time on 429 retries
+        self.request_limiter = AsyncRateLimiter(GEMINI_REQUESTS_PER_MINUTE * rate_share)
+        self.token_limiter = AsyncRateLimiter(GEMINI_TOKENS_PER_MINUTE * rate_share)
+
     def discover_2021_meetings(self) -> List[Dict[str, Any]]:
         """Discover all 2021 meetings from Granicus"""
         logger.info("🔍 Discovering 2021 Torrance City Council meetings...")
@@ -214,6 +409,12 @@ class Torrance2021Processor:
             self.stats['errors'].append(f"Download error for {meeting_id}: {e}")
             return False
 
+    def download_all_meeting_frames(self, meetings: List[Dict[str, Any]]) -> Dict[str, bool]:
+        """Download frames for every meeting concurrently, returning success per meeting ID"""
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            results = executor.map(self.download_meeting_frames, meetings)
+            return {meeting['clip_id']: ok for meeting, ok in zip(meetings, results)}
+
     def _create_placeholder_frames(self, meeting_dir: str, meeting: Dict[str, Any]):
         """Create placeholder frames for testing"""
         # In a real implementation, this would download actual video frames
@@ -221,50 +422,63 @@ class Torrance2021Processor:
         meeting_id = meeting['clip_id']
         votable_chapters = meeting.get('votable_chapters', 10)
 
+        # Only write frames missing from an earlier run
+        with os.scandir(meeting_dir) as entries:
+            existing = {entry.name for entry in entries}
+
         for i in range(votable_chapters * 100):  # Create some frames
             frame_name = f"frame_{i:06d}.jpg"
-            frame_path = os.path.join(meeting_dir, frame_name)
+            if frame_name in existing:
+                continue
 
-            # Create a placeholder file
-            with open(frame_path, 'w') as f:
-                f.write(f"Placeholder frame {i} for meeting {meeting_id}")
+            # Create a placeholder file with raw fd calls, skipping the buffered text-file wrapper
+            fd = os.open(os.path.join(meeting_dir, frame_name), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, f"Placeholder frame {i} for meeting {meeting_id}".encode('utf-8'))
+            finally:
+                os.close(fd)
 
     def process_meeting_frames(self, meeting: Dict[str, Any]) -> Dict[str, Any]:
         """Process all frames for a meeting"""
         meeting_id = meeting['clip_id']
         logger.info(f"🔄 Processing frames for meeting {meeting_id}...")
 
+        # One wall-clock reading stamps every vote and the result for this meeting
+        wall_start = time.time()
+
         meeting_dir = os.path.join(self.config.data_dir, f"votable_frames_{meeting_id}")
 
-        if not os.path.exists(meeting_dir):
+        # Get all frame files; DirEntry carries the full path so no per-frame join is needed
+        try:
+            with os.scandir(meeting_dir) as entries:
+                frame_files = sorted((entry for entry in entries if entry.name.endswith('.jpg')), key=lambda entry: entry.name)
+        except FileNotFoundError:
             logger.error(f"❌ Meeting directory not found: {meeting_dir}")
             return self._create_empty_meeting_result(meeting_id)
 
-        # Get all frame files
-        frame_files = [f for f in os.listdir(meeting_dir) if f.endswith('.jpg')]
-        frame_files.sort()
-
         logger.info(f"📊 Processing {len(frame_files)} frames...")
 
-        vote_candidates = []
-        extracted_votes = []
+        # At most one candidate per frame; fill in place and trim the unused tail afterwards
+        vote_candidates = [None] * len(frame_files)
+        candidate_count = 0
+        votable_count = 0
+        strong_candidates = []
         frames_processed = 0
 
-        for frame_file in frame_files:
-            frame_path = os.path.join(meeting_dir, frame_file)
-            frame_number = self._extract_frame_number(frame_file)
+        for entry in frame_files:
+            frame_number = self._extract_frame_number(entry.name)
 
             # Process frame with OCR
-            candidate = self._process_frame_with_ocr(frame_path, frame_file, frame_number, meeting_id)
+            candidate = self._process_frame_with_ocr(entry.path, entry.name, frame_number, meeting_id)
 
             if candidate:
-                vote_candidates.append(candidate)
+                vote_candidates[candidate_count] = candidate
+                candidate_count += 1
+                votable_count += candidate.has_votable_indicators
 
-                # If it's a strong candidate, try to extract vote
+                # Strong candidates are sent to Gemini once OCR is done
                 if candidate.confidence > self.config.ocr_confidence_threshold:
-                    vote = self._extract_vote_from_candidate(candidate)
-                    if vote:
-                        extracted_votes.append(vote)
+                    strong_candidates.append(candidate)
 
             frames_processed += 1
 
@@ -272,6 +486,11 @@ class Torrance2021Processor:
             if frames_processed % 100 == 0:
                 logger.info(f"📈 Processed {frames_processed}/{len(frame_files)} frames...")
 
+        del vote_candidates[candidate_count:]
+
+        # Extract votes from all strong candidates concurrently
+        extracted_votes = asyncio.run(self._extract_votes(strong_candidates, wall_start))
+
         # Update stats
         self.stats['total_frames_processed'] += frames_processed
         self.stats['vote_candidates_found'] += len(vote_candidates)
@@ -280,22 +499,22 @@ class Torrance2021Processor:
         # Create meeting result
         result = {
             "meeting_id": meeting_id,
-            "processing_timestamp": datetime.now().isoformat(),
+            "processing_timestamp": datetime.fromtimestamp(wall_start).isoformat(),
             "total_frames_processed": frames_processed,
             "vote_candidates_found": len(vote_candidates),
-            "votable_candidates": len([c for c in vote_candidates if c.has_votable_indicators]),
+            "votable_candidates": votable_count,
             "total_votes_extracted": len(extracted_votes),
             "processing_stats": {
                 "ocr_processing": "sequential",
-                "gemini_processing": "sequential",
-                "parallel_processing": False,
+                "gemini_processing": "async",
+                "parallel_processing": True,
                 "votable_indicators_checked": len(self.config.votable_indicators),
                 "frame_size_optimized": f"{self.config.frame_size[0]}x{self.config.frame_size[1]}",
                 "storage_savings": "80%",
                 "speed_improvement": "5x faster"
             },
-            "votes": [self._vote_to_dict(vote) for vote in extracted_votes],
-            "vote_candidates": [self._candidate_to_dict(candidate) for candidate in vote_candidates]
+            "votes": extracted_votes,
+            "vote_candidates": vote_candidates
         }
 
         logger.info(f"✅ Processed meeting {meeting_id}: {len(extracted_votes)} votes extracted")
@@ -303,7 +522,7 @@ class Torrance2021Processor:
 
     def _extract_frame_number(self, frame_file: str) -> int:
         """Extract frame number from filename"""
-        match = re.search(r'frame_(\d+)\.jpg', frame_file)
+        match = _FRAME_RE.search(frame_file)
         return int(match.group(1)) if match else 0
 
     def _process_frame_with_ocr(self, frame_path: str, frame_file: str, frame_number: int, meeting_id: str) -> Optional[VoteCandidate]:
@@ -311,13 +530,10 @@ class Torrance2021Processor:
         try:
             # In a real implementation, this would use actual OCR
             # For now, simulate OCR processing
-            raw_text = self._simulate_ocr(frame_path)
+            raw_text = self._simulate_ocr(frame_path, frame_number)
 
             # Check for votable indicators
-            has_votable_indicators = any(
-                indicator.lower() in raw_text.lower()
-                for indicator in self.config.votable_indicators
-            )
+            has_votable_indicators = self.config._indicator_re.search(raw_text) is not None
 
             if has_votable_indicators:
                 confidence = 0.9  # High confidence for votable frames
@@ -341,11 +557,10 @@ class Torrance2021Processor:
             logger.error(f"Error processing frame {frame_file}: {e}")
             return None
 
-    def _simulate_ocr(self, frame_path: str) -> str:
+    def _simulate_ocr(self, frame_path: str, frame_number: int) -> str:
         """Simulate OCR processing"""
         # In a real implementation, this would use Tesseract or similar OCR
         # For now, return simulated text based on frame number
-        frame_number = self._extract_frame_number(os.path.basename(frame_path))
 
         # Simulate different types of content based on frame number
         if frame_number % 100 == 0:
@@ -355,12 +570,26 @@ class Torrance2021Processor:
         else:
             return "city council meeting\nagenda item discussion\npublic comment period"
 
-    def _extract_vote_from_candidate(self, candidate: VoteCandidate) -> Optional[ExtractedVote]:
+    async def _extract_votes(self, candidates: List[VoteCandidate], extraction_timestamp: float) -> List[ExtractedVote]:
+        """Extract votes from candidates concurrently, preserving frame order"""
+        semaphore = asyncio.Semaphore(GEMINI_CONCURRENCY)
+        self._inflight = {}
+
+        async def extract(candidate: VoteCandidate) -> Optional[ExtractedVote]:
+            async with semaphore:
+                return await self._extract_vote_from_candidate(candidate, extraction_timestamp)
+
+        votes = await asyncio.gather(*(extract(candidate) for candidate in candidates))
+        return [vote for vote in votes if vote]
+
+    async def _extract_vote_from_candidate(self, candidate: VoteCandidate, extraction_timestamp: float) -> Optional[ExtractedVote]:
         """Extract vote data from a candidate using Gemini API"""
         try:
-            # In a real implementation, this would use Gemini API
-            # For now, simulate vote extraction
-            vote_data = self._simulate_gemini_extraction(candidate.raw_text)
+            vote_data = self._extract_tally_from_template(candidate.raw_text)
+            if vote_data:
+                self.stats['template_hits'] += 1
+            else:
+                vote_data = await self._gemini_response(candidate.raw_text)
 
             if vote_data:
                 return ExtractedVote(
@@ -373,7 +602,7 @@ class Torrance2021Processor:
                     frame_path=candidate.frame_path,
                     frame_name=candidate.frame_name,
                     frame_number=candidate.frame_number,
-                    extraction_timestamp=time.time(),
+                    extraction_timestamp=extraction_timestamp,
                     ocr_confidence=candidate.confidence,
                     has_votable_indicators=candidate.has_votable_indicators
                 )
@@ -383,6 +612,58 @@ class Torrance2021Processor:
 
         return None
 
+    def _extract_tally_from_template(self, raw_text: str) -> Optional[Dict[str, Any]]:
+        """Read the tally straight from a standard results screen, or None if it doesn't match"""
+        match = TALLY_RE.search(raw_text)
+        if not match:
+            return None
+
+        ayes, noes, abstentions = (int(group) for group in match.groups())
+        return {
+            "motion_text": None,
+            "vote_tally": {
+                "ayes": ayes,
+                "noes": noes,
+                "abstentions": abstentions
+            },
+            "result": "Motion Passes" if ayes > noes else "Motion Fails",
+            "confidence": "high",
+            "agenda_item": None
+        }
+
+    async def _gemini_response(self, raw_text: str) -> Optional[Dict[str, Any]]:
+        """Return the Gemini response for OCR text, calling the API only on a cache miss"""
+        key = LLMCache.key(raw_text)
+        if key in self.llm_cache:
+            self.stats['gemini_cache_hits'] += 1
+            return self.llm_cache.get(key)
+
+        # Identical frames in the same batch share a single request
+        if key not in self._inflight:
+            self._inflight[key] = asyncio.ensure_future(self._call_gemini(raw_text))
+        vote_data = await self._inflight[key]
+        self.llm_cache.put(key, vote_data)
+        return vote_data
+
+    async def _call_gemini(self, raw_text: str) -> Optional[Dict[str, Any]]:
+        """Call Gemini within the rate limits, retrying transient failures with jittered exponential backoff"""
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(GEMINI_MAX_RETRIES + 1):
+            await self.request_limiter.acquire()
+            await self.token_limiter.acquire(len(raw_text) // 4 + 1)
+
+            try:
+                # In a real implementation, this would use Gemini API
+                # For now, simulate vote extraction; the blocking client call runs off the event loop
+                return await loop.run_in_executor(None, self._simulate_gemini_extraction, raw_text)
+            except RETRYABLE_ERRORS as e:
+                if attempt == GEMINI_MAX_RETRIES:
+                    raise
+                delay = 2 ** attempt + random.random()
+                logger.warning(f"⚠️  Gemini call failed ({e}), retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+
     def _simulate_gemini_extraction(self, raw_text: str) -> Optional[Dict[str, Any]]:
         """Simulate Gemini API extraction"""
         # In a real implementation, this would call Gemini API
@@ -390,9 +671,7 @@ class Torrance2021Processor:
 
         if "voting results" in raw_text.lower():
             # Extract vote tally
-            ayes = 7 if "yea | 7" in raw_text else 5
-            noes = 0 if "nay! |" in raw_text and "nay | 2" not in raw_text else 2
-            abstentions = 0
+            ayes, noes, abstentions = parse_tally(raw_text)
 
             return {
                 "motion_text": None,
@@ -419,8 +698,8 @@ class Torrance2021Processor:
             "total_votes_extracted": 0,
             "processing_stats": {
                 "ocr_processing": "sequential",
-                "gemini_processing": "sequential",
-                "parallel_processing": False,
+                "gemini_processing": "async",
+                "parallel_processing": True,
                 "votable_indicators_checked": len(self.config.votable_indicators),
                 "frame_size_optimized": f"{self.config.frame_size[0]}x{self.config.frame_size[1]}",
                 "storage_savings": "80%",
@@ -430,36 +709,6 @@ class Torrance2021Processor:
             "vote_candidates": []
         }
 
-    def _vote_to_dict(self, vote: ExtractedVote) -> Dict[str, Any]:
-        """Convert ExtractedVote to dictionary"""
-        return {
-            "motion_text": vote.motion_text,
-            "vote_tally": vote.vote_tally,
-            "result": vote.result,
-            "confidence": vote.confidence,
-            "agenda_item": vote.agenda_item,
-            "meeting_id": vote.meeting_id,
-            "frame_path": vote.frame_path,
-            "frame_name": vote.frame_name,
-            "frame_number": vote.frame_number,
-            "extraction_timestamp": vote.extraction_timestamp,
-            "ocr_confidence": vote.ocr_confidence,
-            "has_votable_indicators": vote.has_votable_indicators
-        }
-
-    def _candidate_to_dict(self, candidate: VoteCandidate) -> Dict[str, Any]:
-        """Convert VoteCandidate to dictionary"""
-        return {
-            "frame_path": candidate.frame_path,
-            "frame_name": candidate.frame_name,
-            "frame_number": candidate.frame_number,
-            "confidence": candidate.confidence,
-            "detection_method": candidate.detection_method,
-            "raw_text": candidate.raw_text,
-            "has_votable_indicators": candidate.has_votable_indicators,
-            "meeting_id": candidate.meeting_id
-        }
-
     def save_meeting_result(self, result: Dict[str, Any]):
         """Save meeting result to backup directory"""
         meeting_id = result['meeting_id']
@@ -467,12 +716,13 @@ class Torrance2021Processor:
         filepath = os.path.join(self.config.backup_dir, filename)
 
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+            f.write(_JSON_ENCODER.encode(result))
 
         logger.info(f"💾 Saved meeting result: {filename}")
 
     def save_comprehensive_results(self, all_results: List[Dict[str, Any]]):
         """Save comprehensive results"""
+        processing_time = time.time() - self.stats['start_time']
         comprehensive_results = {
             "processing_summary": {
                 "total_meetings": len(all_results),
@@ -490,16 +740,15 @@ class Torrance2021Processor:
                     "frame_count": r['total_frames_processed'],
                     "vote_candidates": r['vote_candidates_found'],
                     "votes_extracted": r['total_votes_extracted'],
-                    "processing_time": time.time() - self.stats['start_time']
+                    "processing_time": processing_time
                 }
                 for r in all_results
             ]
         }
 
         # Save comprehensive results
-        comprehensive_file = os.path.join(self.config.data_dir, "comprehensive_2021_results.json")
-        with open(comprehensive_file, 'w', encoding='utf-8') as f:
-            json.dump(comprehensive_results, f, indent=2, ensure_ascii=False)
+        comprehensive_file = os.path.join(self.config.data_dir, self.config.results_file)
+        _write_atomic(comprehensive_file, json.dumps(comprehensive_results, indent=2, ensure_ascii=False))
 
         logger.info(f"💾 Saved comprehensive results: {comprehensive_file}")
 
@@ -515,6 +764,8 @@ class Torrance2021Processor:
         logger.info(f"🎬 Total frames processed: {self.stats['total_frames_processed']}")
         logger.info(f"🔍 Vote candidates found: {self.stats['vote_candidates_found']}")
         logger.info(f"🗳️  Votes extracted: {self.stats['votes_extracted']}")
+        logger.info(f"♻️  Gemini cache hits: {self.stats['gemini_cache_hits']}")
+        logger.info(f"📐 Template tally hits: {self.stats['template_hits']}")
 
         if self.stats['errors']:
             logger.warning(f"⚠️  Errors encountered: {len(self.stats['errors'])}")
@@ -523,12 +774,13 @@ class Torrance2021Processor:
 
         logger.info("=" * 60)
 
-    def process_all_meetings(self):
-        """Main processing loop"""
+    def process_all_meetings(self, meetings: Optional[List[Dict[str, Any]]] = None):
+        """Main processing loop; discovers meetings unless a list is given"""
         logger.info("🚀 Starting 2021 Torrance City Council meeting processing...")
 
         # Discover meetings
-        meetings = self.discover_2021_meetings()
+        if meetings is None:
+            meetings = self.discover_2021_meetings()
 
         if not meetings:
             logger.error("❌ No meetings found for 2021")
@@ -545,39 +797,55 @@ class Torrance2021Processor:
             meetings = meetings[start_index:]
             logger.info(f"🔄 Resuming from meeting {self.config.resume_from}")
 
-        all_results = []
-
-        for i, meeting in enumerate(meetings, 1):
-            meeting_id = meeting['clip_id']
-            logger.info(f"\n📋 Processing meeting {i}/{len(meetings)}: {meeting_id}")
+        # Fetch every meeting's frames up front so downloads overlap instead of blocking each meeting
+        downloaded = self.download_all_meeting_frames(meetings)
 
-            try:
-                # Download frames
-                if not self.download_meeting_frames(meeting):
-                    logger.error(f"❌ Failed to download frames for meeting {meeting_id}")
+        ready = []
+        for i, meeting in enumerate(meetings):
+            if not downloaded[meeting['clip_id']]:
+                logger.error(f"❌ Failed to download frames for meeting {meeting['clip_id']}")
+                continue
+            ready.append(i)
+
+        # Frame processing is CPU-bound, so meetings run in separate worker processes; each
+        # worker takes a whole meeting, so a single-meeting run (--meetings-stdin from
+        # process_2021_complete.py) starts one worker rather than one per CPU
+        results_by_index = {}
+        workers = max(1, min(os.cpu_count() or 1, len(ready)))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self.config, self.config.rate_share / workers)) as executor:
+            futures = {executor.submit(_process_one_meeting, meetings[i]): i for i in ready}
+
+            for completed, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                meeting_id = meetings[i]['clip_id']
+
+                try:
+                    result, counters, errors, cache_entries = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Error processing meeting {meeting_id}: {e}")
+                    self.stats['errors'].append(f"Meeting {meeting_id}: {e}")
                     continue
 
-                # Process frames
-                result = self.process_meeting_frames(meeting)
+                for key, value in counters.items():
+                    self.stats[key] += value
+                self.stats['errors'].extend(errors)
+                self.llm_cache.update(cache_entries)
 
-                # Save individual result
-                self.save_meeting_result(result)
-
-                all_results.append(result)
+                results_by_index[i] = result
                 self.stats['meetings_processed'] += 1
 
                 # Progress update
-                logger.info(f"📈 Progress: {i}/{len(meetings)} meetings completed")
+                logger.info(f"📈 Progress: {completed}/{len(futures)} meetings completed ({meeting_id})")
 
-            except Exception as e:
-                logger.error(f"❌ Error processing meeting {meeting_id}: {e}")
-                self.stats['errors'].append(f"Meeting {meeting_id}: {e}")
-                continue
+        # Keep results in meeting order regardless of completion order
+        all_results = [results_by_index[i] for i in sorted(results_by_index)]
 
         # Save comprehensive results
         if all_results:
             self.save_comprehensive_results(all_results)
 
+        self.llm_cache.save()
+
         # Print final stats
         self.print_final_stats()
 
@@ -586,7 +854,10 @@ def main():
     parser = argparse.ArgumentParser(description='Process All 2021 Votable Meetings Sequential')
     parser.add_argument('--meetings', type=int, help='Maximum number of meetings to process')
     parser.add_argument('--resume', help='Resume from specific meeting ID')
-    parser.add_argument('--gemini-key', help='Gemini API key for vote extraction')
+    parser.add_argument('--gemini-key', help='Gemini API key for vote extraction (defaults to GEMINI_API_KEY)')
+    parser.add_argument('--meetings-stdin', action='store_true', help='Read the meetings list as JSON from stdin')
+    parser.add_argument('--results-file', default=MeetingConfig.results_file, help='Comprehensive results file name within the data directory')
+    parser.add_argument('--rate-share', type=float, default=1.0, help='Fraction of the Gemini quota to use, when other runs share it')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose logging')
 
     args = parser.parse_args()
@@ -599,12 +870,15 @@ def main():
     config = MeetingConfig(
         max_meetings=args.meetings,
         resume_from=args.resume,
-        gemini_api_key=args.gemini_key
+        results_file=args.results_file,
+        rate_share=args.rate_share,
+        gemini_api_key=args.gemini_key or os.environ.get('GEMINI_API_KEY')
     )
 
     # Create processor and run
     processor = Torrance2021Processor(config)
-    processor.process_all_meetings()
+    meetings = json.load(sys.stdin) if args.meetings_stdin else None
+    processor.process_all_meetings(meetings)
 
 if __name__ == '__main__':
     main()
@@ -4,6 +4,23 @@ Remove votes for non-votable agenda items like Oral Communications, Adjournment,
 """
 
 import json
+import re
+from collections import Counter, defaultdict
+from vote_data import fold_vote_pairs, write_json_bytes
+
+# Non-votable agenda item patterns
+NON_VOTABLE_PATTERNS = [
+    'oral communications',
+    'adjournment',
+    'presentation only',
+    'for presentation',
+    'announcement',
+    'council committee meetings',
+    'committee meetings and announcements'
+]
+
+# All patterns in one case-insensitive alternation so each agenda item is scanned once, without lowercasing
+NON_VOTABLE_RE = re.compile('|'.join(map(re.escape, NON_VOTABLE_PATTERNS)), re.IGNORECASE)
 
 def is_non_votable_agenda_item(agenda_item):
     """Check if an agenda item is non-votable"""
@@ -12,24 +29,13 @@ def is_non_votable_agenda_item(agenda_item):
 
     # Handle both string and object agenda items
     if isinstance(agenda_item, str):
-        agenda_lower = agenda_item.lower()
+        agenda_text = agenda_item
     elif isinstance(agenda_item, dict):
-        agenda_lower = agenda_item.get('description', '').lower()
+        agenda_text = agenda_item.get('description', '')
     else:
         return False
 
-    # Non-votable agenda item patterns
-    non_votable_patterns = [
-        'oral communications',
-        'adjournment',
-        'presentation only',
-        'for presentation',
-        'announcement',
-        'council committee meetings',
-        'committee meetings and announcements'
-    ]
-
-    return any(pattern in agenda_lower for pattern in non_votable_patterns)
+    return NON_VOTABLE_RE.search(agenda_text) is not None
 
 def remove_non_votable_votes():
     # Load the data
@@ -65,26 +71,31 @@ def remove_non_votable_votes():
             'abstentions': 0
         }
 
-    for vote in votable_votes:
-        if 'individual_votes' in vote and vote['individual_votes']:
-            for cm, vote_result in vote['individual_votes'].items():
-                if cm in councilmember_stats:
-                    councilmember_stats[cm]['total_votes'] += 1
-                    if vote_result == 'YES':
-                        councilmember_stats[cm]['yes_votes'] += 1
-                    elif vote_result == 'NO':
-                        councilmember_stats[cm]['no_votes'] += 1
-                    elif vote_result == 'ABSTAIN':
-                        councilmember_stats[cm]['abstentions'] += 1
+    # One pass over the votable votes fills the stats, the per-meeting vote counts
+    # and the distinct agenda items each councilmember voted on
+    meeting_vote_counts = Counter()
+    areas_per_cm = defaultdict(set)
+    pair_counts = Counter()
 
-    data['councilmember_stats'] = councilmember_stats
-
-    # Update meeting vote counts
-    meeting_vote_counts = {}
     for vote in votable_votes:
         meeting_id = vote.get('meeting_id')
         if meeting_id:
-            meeting_vote_counts[meeting_id] = meeting_vote_counts.get(meeting_id, 0) + 1
+            meeting_vote_counts[meeting_id] += 1
+
+        individual_votes = vote.get('individual_votes')
+        if not individual_votes:
+            continue
+
+        pair_counts.update(individual_votes.items())
+
+        agenda_key = str(vote.get('agenda_item', ''))
+        for cm in individual_votes:
+            areas_per_cm[cm].add(agenda_key)
+
+    # Fold the distinct (councilmember, result) counts into the stats
+    fold_vote_pairs(pair_counts, councilmember_stats)
+
+    data['councilmember_stats'] = councilmember_stats
 
     # Update meetings data
     for meeting_id, meeting_data in data['meetings'].items():
@@ -101,7 +112,7 @@ def remove_non_votable_votes():
                 f"Participated in {stats['total_votes']} recorded votes",
                 f"Voted Yes on {stats['yes_votes']} motions",
                 f"Voted No on {stats['no_votes']} motions",
-                f"Active in {len(set(str(vote.get('agenda_item', '')) for vote in votable_votes if 'individual_votes' in vote and cm in vote['individual_votes']))} policy areas"
+                f"Active in {len(areas_per_cm.get(cm, ()))} policy areas"
             ]
             data['councilmember_summaries'][cm]['stats'] = {
                 'total_votes': stats['total_votes'],
@@ -110,8 +121,7 @@ def remove_non_votable_votes():
             }
 
     # Save the cleaned data
-    with open('data/torrance_votes_smart_consolidated.json', 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json_bytes('data/torrance_votes_smart_consolidated.json', data)
 
     print(f"\n✅ Removed {len(non_votable_votes)} non-votable votes!")
     print(f"📊 Updated vote counts:")
@@ -10,49 +10,33 @@ import os
 import json
 from bulletproof_import import BulletproofImporter, ImportConfig
 
-def create_sample_data():
-    """Create sample data for testing"""
+# Every sample vote is unanimous, so the votes share one individual_votes mapping
+SAMPLE_INDIVIDUAL_VOTES = {
+    "GEORGE CHEN": "YES",
+    "MIKE GERSON": "YES",
+    "JON KAJI": "YES",
+    "SHARON KALANI": "YES",
+    "ASAM SHEIKH": "YES"
+}
+
+SAMPLE_AGENDA_ITEMS = [
+    "1. Call to Order",
+    "2. Pledge of Allegiance",
+    "3. Public Comment"
+]
+
+def create_sample_data(compact=False):
+    """Create sample data for testing; compact=True skips indentation for machine consumers"""
     sample_data = {
         "votes": [
             {
-                "id": "14520_1",
+                "id": f"14520_{frame_number}",
                 "meeting_id": "14520",
-                "agenda_item": "1. Call to Order",
-                "frame_number": 1,
-                "individual_votes": {
-                    "GEORGE CHEN": "YES",
-                    "MIKE GERSON": "YES",
-                    "JON KAJI": "YES",
-                    "SHARON KALANI": "YES",
-                    "ASAM SHEIKH": "YES"
-                }
-            },
-            {
-                "id": "14520_2",
-                "meeting_id": "14520",
-                "agenda_item": "2. Pledge of Allegiance",
-                "frame_number": 2,
-                "individual_votes": {
-                    "GEORGE CHEN": "YES",
-                    "MIKE GERSON": "YES",
-                    "JON KAJI": "YES",
-                    "SHARON KALANI": "YES",
-                    "ASAM SHEIKH": "YES"
-                }
-            },
-            {
-                "id": "14520_3",
-                "meeting_id": "14520",
-                "agenda_item": "3. Public Comment",
-                "frame_number": 3,
-                "individual_votes": {
-                    "GEORGE CHEN": "YES",
-                    "MIKE GERSON": "YES",
-                    "JON KAJI": "YES",
-                    "SHARON KALANI": "YES",
-                    "ASAM SHEIKH": "YES"
-                }
+                "agenda_item": agenda_item,
+                "frame_number": frame_number,
+                "individual_votes": SAMPLE_INDIVIDUAL_VOTES
             }
+            for frame_number, agenda_item in enumerate(SAMPLE_AGENDA_ITEMS, 1)
         ],
         "meetings": {
             "14520": {
@@ -67,7 +51,10 @@ def create_sample_data():
     }
 
     with open('sample_new_meeting.json', 'w') as f:
-        json.dump(sample_data, f, indent=2)
+        if compact:
+            json.dump(sample_data, f, separators=(',', ':'))
+        else:
+            json.dump(sample_data, f, indent=2)
 
     print("Sample data created: sample_new_meeting.json")
 
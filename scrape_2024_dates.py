@@ -3,45 +3,76 @@
 Scrape actual meeting dates from Granicus meeting pages
 """
 
+import argparse
+import logging
+import sys
 import requests
 import json
 import re
+from granicus_scrape import make_session, prefetch_pages, meetings_in_range, load_json_cache, save_json_atomic, NUMERIC_DATE, MONTH_DATE
 from datetime import datetime
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Per-meeting detail is logged at DEBUG (--verbose); warnings and the summary at INFO
+logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+logger = logging.getLogger(__name__)
+
+# Requests kept in flight at once; pages are still parsed on the main thread in meeting order
+FETCH_WORKERS = 16
+
+# Scraped dates, also read back on the next run
+OUTPUT_FILE = 'scraped_2024_dates.json'
+
+# Progress is saved after this many newly scraped results, so an interrupted run resumes where it stopped
+SAVE_EVERY = 10
+
+# Date formats compiled once; each alternation finds the leftmost date in a single scan
+NUMERIC_DATE_RE = re.compile(f'({NUMERIC_DATE})')
+DATE_RE = re.compile(f'({NUMERIC_DATE}|{MONTH_DATE})')
+
+# The title and meta tags are all the first two methods read, so only they are built into a tree
+HEAD_TAGS = SoupStrainer(['title', 'meta'])
+
+def granicus_url_for(meeting_id):
+    """Granicus player page for a meeting"""
+    return f"https://torrance.granicus.com/player/clip/{meeting_id}"
 
 def scrape_meeting_dates():
     """Scrape actual meeting dates from Granicus pages"""
 
-    # Load vote data
-    with open('data/torrance_votes_smart_consolidated.json', 'r') as f:
-        data = json.load(f)
+    # Load vote data in one raw read; json.loads decodes the bytes itself
+    with open('data/torrance_votes_smart_consolidated.json', 'rb') as f:
+        data = json.loads(f.read())
 
-    print("🔍 Scraping actual meeting dates from Granicus pages...")
+    logger.info("🔍 Scraping actual meeting dates from Granicus pages...")
 
     # Get all 2024 meetings
-    meetings_2024 = []
-    for meeting_id, meeting_data in data.get('meetings', {}).items():
-        if meeting_id.startswith('14') and int(meeting_id) < 14400:
-            meetings_2024.append((meeting_id, meeting_data))
+    meetings_2024 = meetings_in_range(data)
 
-    print(f"Found {len(meetings_2024)} 2024 meetings to check")
+    # Dates saved by earlier runs are kept; only meetings still missing one are scraped
+    scraped_dates = load_json_cache(OUTPUT_FILE)
+    saved_count = len(scraped_dates)
+    meetings_2024 = [(meeting_id, meeting_data) for meeting_id, meeting_data in meetings_2024 if meeting_id not in scraped_dates]
+
+    logger.info(f"Found {len(meetings_2024)} 2024 meetings to check ({saved_count} already scraped)")
 
     # Scrape dates from Granicus pages
-    scraped_dates = {}
+    # One session for every request so connections to Granicus are reused
+    session = make_session(FETCH_WORKERS)
+    pending_pages = prefetch_pages(session, FETCH_WORKERS, (granicus_url_for(meeting_id) for meeting_id, _ in meetings_2024))
 
-    for meeting_id, meeting_data in meetings_2024:
-        print(f"\n📋 Checking Meeting {meeting_id}...")
+    for (meeting_id, meeting_data), page in zip(meetings_2024, pending_pages):
+        logger.debug(f"\n📋 Checking Meeting {meeting_id}...")
 
         # Construct Granicus URL
-        granicus_url = f"https://torrance.granicus.com/player/clip/{meeting_id}"
+        granicus_url = granicus_url_for(meeting_id)
 
         try:
-            # Make request to Granicus page
-            response = requests.get(granicus_url, timeout=10)
-            response.raise_for_status()
+            # Wait for the page requested in the background
+            response = page.result()
 
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Parse HTML, keeping only the title and meta tags
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=HEAD_TAGS)
 
             # Look for date information in various places
             date_found = False
@@ -50,23 +81,15 @@ def scrape_meeting_dates():
             title_tag = soup.find('title')
             if title_tag:
                 title_text = title_tag.get_text()
-                print(f"  Title: {title_text}")
+                logger.debug(f"  Title: {title_text}")
 
                 # Try to extract date from title
-                date_patterns = [
-                    r'(\d{1,2}/\d{1,2}/\d{4})',  # MM/DD/YYYY
-                    r'(\d{4}-\d{2}-\d{2})',      # YYYY-MM-DD
-                    r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}',  # Month DD, YYYY
-                ]
-
-                for pattern in date_patterns:
-                    match = re.search(pattern, title_text)
-                    if match:
-                        date_str = match.group(1)
-                        print(f"  Found date in title: {date_str}")
-                        scraped_dates[meeting_id] = date_str
-                        date_found = True
-                        break
+                match = DATE_RE.search(title_text)
+                if match:
+                    date_str = match.group(1)
+                    logger.debug(f"  Found date in title: {date_str}")
+                    scraped_dates[meeting_id] = date_str
+                    date_found = True
 
             # Method 2: Look for date in meta tags
             if not date_found:
@@ -74,52 +97,60 @@ def scrape_meeting_dates():
                 for meta in meta_tags:
                     content = meta.get('content', '')
                     if 'date' in meta.get('name', '').lower() or 'date' in meta.get('property', '').lower():
-                        print(f"  Meta date: {content}")
+                        logger.debug(f"  Meta date: {content}")
                         scraped_dates[meeting_id] = content
                         date_found = True
                         break
 
             # Method 3: Look for date in page content
             if not date_found:
-                page_text = soup.get_text()
-                date_patterns = [
-                    r'(\d{1,2}/\d{1,2}/\d{4})',  # MM/DD/YYYY
-                    r'(\d{4}-\d{2}-\d{2})',      # YYYY-MM-DD
-                ]
-
-                for pattern in date_patterns:
-                    matches = re.findall(pattern, page_text)
-                    if matches:
+                # Only now build the whole page; walk its strings in document order and stop at
+                # the first date, instead of joining the whole page into one string
+                page_soup = BeautifulSoup(response.content, 'lxml')
+                for page_string in page_soup.stripped_strings:
+                    match = NUMERIC_DATE_RE.search(page_string)
+                    if match:
                         # Take the first date found
-                        date_str = matches[0]
-                        print(f"  Found date in content: {date_str}")
+                        date_str = match.group(1)
+                        logger.debug(f"  Found date in content: {date_str}")
                         scraped_dates[meeting_id] = date_str
                         date_found = True
                         break
 
             if not date_found:
-                print(f"  ❌ No date found for meeting {meeting_id}")
+                logger.warning(f"  ❌ No date found for meeting {meeting_id}")
 
         except requests.exceptions.RequestException as e:
-            print(f"  ❌ Error accessing {granicus_url}: {e}")
+            logger.warning(f"  ❌ Error accessing {granicus_url}: {e}")
         except Exception as e:
-            print(f"  ❌ Error parsing page for meeting {meeting_id}: {e}")
+            logger.warning(f"  ❌ Error parsing page for meeting {meeting_id}: {e}")
+
+        # Checkpoint newly scraped dates periodically
+        if len(scraped_dates) - saved_count >= SAVE_EVERY:
+            save_json_atomic(OUTPUT_FILE, scraped_dates)
+            saved_count = len(scraped_dates)
 
     # Display results
-    print(f"\n📊 Scraping Results:")
-    print(f"   - Successfully scraped: {len(scraped_dates)} dates")
+    logger.info(f"\n📊 Scraping Results:")
+    logger.info(f"   - Successfully scraped: {len(scraped_dates)} dates")
 
     if scraped_dates:
-        print(f"\n🔍 Scraped Dates:")
+        logger.info(f"\n🔍 Scraped Dates:")
         for meeting_id, date_str in scraped_dates.items():
-            print(f"   - Meeting {meeting_id}: {date_str}")
+            logger.info(f"   - Meeting {meeting_id}: {date_str}")
 
     # Save scraped dates to file for review
-    with open('scraped_2024_dates.json', 'w') as f:
-        json.dump(scraped_dates, f, indent=2)
+    save_json_atomic(OUTPUT_FILE, scraped_dates)
 
-    print(f"\n💾 Scraped dates saved to 'scraped_2024_dates.json'")
-    print(f"   - Review the dates and update the main data file if they look correct")
+    logger.info(f"\n💾 Scraped dates saved to '{OUTPUT_FILE}'")
+    logger.info(f"   - Review the dates and update the main data file if they look correct")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Scrape meeting dates from Granicus pages')
+    parser.add_argument('--verbose', action='store_true', help='Log per-meeting detail')
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
     scrape_meeting_dates()
@@ -3,50 +3,68 @@
 Scrape actual meeting dates from Granicus agenda pages
 """
 
+import argparse
+import logging
+import sys
 import requests
 import json
 import re
+from granicus_scrape import make_session, prefetch_pages, meetings_in_range, NUMERIC_DATE, MONTH_DATE
 from datetime import datetime
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Per-meeting detail is logged at DEBUG (--verbose); warnings and the summary at INFO
+logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+logger = logging.getLogger(__name__)
+
+# Requests kept in flight at once; pages are still parsed on the main thread in meeting order
+FETCH_WORKERS = 16
+
+# Date formats compiled once; each alternation finds the leftmost date in a single scan
+NUMERIC_DATE_RE = re.compile(f'({NUMERIC_DATE})')
+DATE_RE = re.compile(f'({NUMERIC_DATE}|{MONTH_DATE})')
+
+# Method 1 reads only the title, so the first parse builds just that
+TITLE_TAG = SoupStrainer('title')
 
 def scrape_agenda_dates():
     """Scrape actual meeting dates from Granicus agenda pages"""
 
-    # Load vote data
-    with open('data/torrance_votes_smart_consolidated.json', 'r') as f:
-        data = json.load(f)
+    # Load vote data in one raw read; json.loads decodes the bytes itself
+    with open('data/torrance_votes_smart_consolidated.json', 'rb') as f:
+        data = json.loads(f.read())
 
-    print("🔍 Scraping actual meeting dates from Granicus agenda pages...")
+    logger.info("🔍 Scraping actual meeting dates from Granicus agenda pages...")
 
     # Get all 2024 meetings
-    meetings_2024 = []
-    for meeting_id, meeting_data in data.get('meetings', {}).items():
-        if meeting_id.startswith('14') and int(meeting_id) < 14400:
-            meetings_2024.append((meeting_id, meeting_data))
+    meetings_2024 = meetings_in_range(data)
 
-    print(f"Found {len(meetings_2024)} 2024 meetings to check")
+    logger.info(f"Found {len(meetings_2024)} 2024 meetings to check")
 
     # Scrape dates from agenda pages
     scraped_dates = {}
 
-    for meeting_id, meeting_data in meetings_2024:
-        print(f"\n📋 Checking Meeting {meeting_id}...")
+    # One session for every request so connections to Granicus are reused
+    session = make_session(FETCH_WORKERS)
+    pending_pages = prefetch_pages(session, FETCH_WORKERS, (meeting_data.get('agenda_url') for _, meeting_data in meetings_2024))
+
+    for (meeting_id, meeting_data), page in zip(meetings_2024, pending_pages):
+        logger.debug(f"\n📋 Checking Meeting {meeting_id}...")
 
         # Get agenda URL
         agenda_url = meeting_data.get('agenda_url')
         if not agenda_url:
-            print(f"  ❌ No agenda URL for meeting {meeting_id}")
+            logger.warning(f"  ❌ No agenda URL for meeting {meeting_id}")
             continue
 
-        print(f"  Agenda URL: {agenda_url}")
+        logger.debug(f"  Agenda URL: {agenda_url}")
 
         try:
-            # Make request to agenda page
-            response = requests.get(agenda_url, timeout=10)
-            response.raise_for_status()
+            # Wait for the agenda page requested in the background
+            response = page.result()
 
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Parse HTML, keeping only the title
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=TITLE_TAG)
 
             # Look for date information in various places
             date_found = False
@@ -55,41 +73,30 @@ def scrape_agenda_dates():
             title_tag = soup.find('title')
             if title_tag:
                 title_text = title_tag.get_text()
-                print(f"  Title: {title_text}")
+                logger.debug(f"  Title: {title_text}")
 
                 # Try to extract date from title
-                date_patterns = [
-                    r'(\d{1,2}/\d{1,2}/\d{4})',  # MM/DD/YYYY
-                    r'(\d{4}-\d{2}-\d{2})',      # YYYY-MM-DD
-                    r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}',  # Month DD, YYYY
-                ]
-
-                for pattern in date_patterns:
-                    match = re.search(pattern, title_text)
-                    if match:
-                        date_str = match.group(1)
-                        print(f"  Found date in title: {date_str}")
-                        scraped_dates[meeting_id] = date_str
-                        date_found = True
-                        break
+                match = DATE_RE.search(title_text)
+                if match:
+                    date_str = match.group(1)
+                    logger.debug(f"  Found date in title: {date_str}")
+                    scraped_dates[meeting_id] = date_str
+                    date_found = True
+
+            # Methods 2 and 3 need the whole page, so build it only when the title had no date
+            if not date_found:
+                soup = BeautifulSoup(response.content, 'lxml')
 
             # Method 2: Look for date in page content
             if not date_found:
-                page_text = soup.get_text()
-
-                # Look for common date patterns
-                date_patterns = [
-                    r'(\d{1,2}/\d{1,2}/\d{4})',  # MM/DD/YYYY
-                    r'(\d{4}-\d{2}-\d{2})',      # YYYY-MM-DD
-                    r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}',  # Month DD, YYYY
-                ]
-
-                for pattern in date_patterns:
-                    matches = re.findall(pattern, page_text)
-                    if matches:
+                # Look for common date patterns, walking the page's strings in document order
+                # and stopping at the first date instead of joining the whole page into one string
+                for page_string in soup.stripped_strings:
+                    match = DATE_RE.search(page_string)
+                    if match:
                         # Take the first date found
-                        date_str = matches[0]
-                        print(f"  Found date in content: {date_str}")
+                        date_str = match.group(1)
+                        logger.debug(f"  Found date in content: {date_str}")
                         scraped_dates[meeting_id] = date_str
                         date_found = True
                         break
@@ -97,38 +104,45 @@ def scrape_agenda_dates():
             # Method 3: Look for specific meeting date elements
             if not date_found:
                 # Look for elements that might contain meeting dates
-                date_elements = soup.find_all(['h1', 'h2', 'h3', 'div', 'span'], string=re.compile(r'\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{2}-\d{2}'))
+                date_elements = soup.find_all(['h1', 'h2', 'h3', 'div', 'span'], string=NUMERIC_DATE_RE)
                 for element in date_elements:
                     text = element.get_text().strip()
-                    print(f"  Potential date element: {text}")
-                    if re.search(r'\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{2}-\d{2}', text):
+                    logger.debug(f"  Potential date element: {text}")
+                    if NUMERIC_DATE_RE.search(text):
                         scraped_dates[meeting_id] = text
                         date_found = True
                         break
 
             if not date_found:
-                print(f"  ❌ No date found for meeting {meeting_id}")
+                logger.warning(f"  ❌ No date found for meeting {meeting_id}")
 
         except requests.exceptions.RequestException as e:
-            print(f"  ❌ Error accessing {agenda_url}: {e}")
+            logger.warning(f"  ❌ Error accessing {agenda_url}: {e}")
         except Exception as e:
-            print(f"  ❌ Error parsing page for meeting {meeting_id}: {e}")
+            logger.warning(f"  ❌ Error parsing page for meeting {meeting_id}: {e}")
 
     # Display results
-    print(f"\n📊 Scraping Results:")
-    print(f"   - Successfully scraped: {len(scraped_dates)} dates")
+    logger.info(f"\n📊 Scraping Results:")
+    logger.info(f"   - Successfully scraped: {len(scraped_dates)} dates")
 
     if scraped_dates:
-        print(f"\n🔍 Scraped Dates:")
+        logger.info(f"\n🔍 Scraped Dates:")
         for meeting_id, date_str in scraped_dates.items():
-            print(f"   - Meeting {meeting_id}: {date_str}")
+            logger.info(f"   - Meeting {meeting_id}: {date_str}")
 
     # Save scraped dates to file for review
     with open('scraped_2024_agenda_dates.json', 'w') as f:
         json.dump(scraped_dates, f, indent=2)
 
-    print(f"\n💾 Scraped dates saved to 'scraped_2024_agenda_dates.json'")
-    print(f"   - Review the dates and update the main data file if they look correct")
+    logger.info(f"\n💾 Scraped dates saved to 'scraped_2024_agenda_dates.json'")
+    logger.info(f"   - Review the dates and update the main data file if they look correct")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Scrape meeting dates from Granicus agenda pages')
+    parser.add_argument('--verbose', action='store_true', help='Log per-meeting detail')
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
     scrape_agenda_dates()
@@ -48,7 +48,7 @@ def scrape_meeting_dates_with_redirect():
             print(f"  Status: {response.status_code}")
 
             # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
 
             # Look for date information in various places
             date_found = False
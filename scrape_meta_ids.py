@@ -3,108 +3,210 @@
 Scrape meta_ids from Granicus agenda pages to create accurate video deep links
 """
 
+import argparse
+import logging
+import sys
 import json
-import requests
-from bs4 import BeautifulSoup
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 from urllib.parse import urljoin
+from granicus_scrape import make_session, load_json_cache, save_json_atomic
+from vote_data import write_json_bytes
+
+# Per-meeting detail is logged at DEBUG (--verbose); warnings and the summary at INFO
+logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+logger = logging.getLogger(__name__)
+
+# Scraped meta_ids per meeting, also read back on the next run
+MAPPING_FILE = 'data/meta_id_mapping.json'
+
+# Agenda pages fetched and parsed at once
+FETCH_WORKERS = 16
+
+META_ID_RE = re.compile(r'meta_id=(\d+)')
+
+# Only links carrying a meta_id are built into the parse tree
+META_ID_LINKS = SoupStrainer('a', href=META_ID_RE)
+
+# Progress is saved after this many newly scraped results, so an interrupted run resumes where it stopped
+SAVE_EVERY = 10
+
+# Runs of letters and digits in lowercased agenda text; only runs this long are indexed
+WORD_RE = re.compile(r'[a-z0-9]+')
+MIN_TOKEN_LENGTH = 4
+
+def word_tokens(text):
+    """Distinctive whole-word tokens of a lowercased agenda text"""
+    return {match.group() for match in WORD_RE.finditer(text) if len(match.group()) >= MIN_TOKEN_LENGTH}
+
+def interior_tokens(text):
+    """Tokens not touching either end of text, so they stay whole tokens in any string containing it"""
+    return {
+        match.group() for match in WORD_RE.finditer(text)
+        if len(match.group()) >= MIN_TOKEN_LENGTH and match.start() > 0 and match.end() < len(text)
+    }
+
+def build_agenda_index(meeting_meta_ids):
+    """Inverted index over one meeting's lowercased agenda texts for narrowing partial-match candidates"""
+    entries = [(agenda_text.lower(), meta_id) for agenda_text, meta_id in meeting_meta_ids.items()]
+    by_token = defaultdict(set)     # token -> entries containing it as a whole word
+    by_interior = defaultdict(set)  # token -> entries with it as an interior word
+    always = set()                  # entries with no interior tokens; any item may contain them
+
+    for i, (text_lc, _) in enumerate(entries):
+        for token in word_tokens(text_lc):
+            by_token[token].add(i)
+        interior = interior_tokens(text_lc)
+        for token in interior:
+            by_interior[token].add(i)
+        if not interior:
+            always.add(i)
+
+    return entries, by_token, by_interior, always
+
+def fetch_meta_ids(session, meeting_id):
+    """Fetch one meeting's agenda page and map each linked agenda item's text to its meta_id"""
+    agenda_url = f"https://torrance.granicus.com/GeneratedAgendaViewer.php?view_id=8&clip_id={meeting_id}"
+    response = session.get(agenda_url, timeout=10)
+    response.raise_for_status()
+
+    # Parse HTML, keeping only the links with meta_id parameters
+    soup = BeautifulSoup(response.content, 'lxml', parse_only=META_ID_LINKS)
+
+    meeting_meta_ids = {}
+    for link in soup.find_all('a'):
+        # Get the agenda item text
+        agenda_text = link.get_text(strip=True)
+        if agenda_text:
+            # Extract meta_id from URL
+            meeting_meta_ids[agenda_text] = META_ID_RE.search(link['href']).group(1)
+
+    return meeting_meta_ids
 
 def scrape_meta_ids():
     """Scrape meta_ids from Granicus agenda pages"""
 
-    # Load our vote data
-    with open('data/torrance_votes_consolidated_final.json', 'r') as f:
-        data = json.load(f)
+    # Load our vote data in one raw read; json.loads decodes the bytes itself
+    with open('data/torrance_votes_consolidated_final.json', 'rb') as f:
+        data = json.loads(f.read())
 
     # Get all unique meeting IDs
     meeting_ids = list(data['meetings'].keys())
-    print(f"Found {len(meeting_ids)} meetings to scrape: {meeting_ids}")
+    logger.info(f"Found {len(meeting_ids)} meetings to scrape: {meeting_ids}")
 
-    meta_id_mapping = {}
+    # Meetings scraped successfully by an earlier run are kept; failed (empty) ones are retried
+    meta_id_mapping = load_json_cache(MAPPING_FILE)
+    pending_ids = [meeting_id for meeting_id in meeting_ids if not meta_id_mapping.get(meeting_id)]
+    logger.info(f"{len(meeting_ids) - len(pending_ids)} meetings already scraped, {len(pending_ids)} to go")
 
-    for meeting_id in meeting_ids:
-        print(f"\n🔍 Scraping meeting {meeting_id}...")
+    # One session for every request so connections to Granicus are reused
+    session = make_session(FETCH_WORKERS)
+    scraped_since_save = 0
 
-        # Construct agenda URL
-        agenda_url = f"https://torrance.granicus.com/GeneratedAgendaViewer.php?view_id=8&clip_id={meeting_id}"
+    # Fetch and parse agenda pages on a thread pool; results are reported in meeting order
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        pending = [executor.submit(fetch_meta_ids, session, meeting_id) for meeting_id in pending_ids]
 
-        try:
-            # Fetch the agenda page
-            response = requests.get(agenda_url, timeout=10)
-            response.raise_for_status()
+        for meeting_id, future in zip(pending_ids, pending):
+            logger.debug(f"\n🔍 Scraping meeting {meeting_id}...")
 
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Find all links with meta_id parameters
-            links = soup.find_all('a', href=True)
-            meeting_meta_ids = {}
-
-            for link in links:
-                href = link['href']
-                if 'meta_id=' in href:
-                    # Extract meta_id from URL
-                    meta_id_match = re.search(r'meta_id=(\d+)', href)
-                    if meta_id_match:
-                        meta_id = meta_id_match.group(1)
+            try:
+                meeting_meta_ids = future.result()
+                for agenda_text, meta_id in meeting_meta_ids.items():
+                    logger.debug(f"  Found: {agenda_text[:50]}... -> meta_id={meta_id}")
 
-                        # Get the agenda item text
-                        agenda_text = link.get_text(strip=True)
-                        if agenda_text:
-                            meeting_meta_ids[agenda_text] = meta_id
-                            print(f"  Found: {agenda_text[:50]}... -> meta_id={meta_id}")
+                meta_id_mapping[meeting_id] = meeting_meta_ids
+                logger.debug(f"  ✅ Scraped {len(meeting_meta_ids)} agenda items for meeting {meeting_id}")
 
-            meta_id_mapping[meeting_id] = meeting_meta_ids
-            print(f"  ✅ Scraped {len(meeting_meta_ids)} agenda items for meeting {meeting_id}")
+            except Exception as e:
+                logger.warning(f"  ❌ Error scraping meeting {meeting_id}: {e}")
+                meta_id_mapping[meeting_id] = {}
 
-        except Exception as e:
-            print(f"  ❌ Error scraping meeting {meeting_id}: {e}")
-            meta_id_mapping[meeting_id] = {}
+            # Checkpoint newly scraped meetings periodically
+            scraped_since_save += 1
+            if scraped_since_save >= SAVE_EVERY:
+                save_json_atomic(MAPPING_FILE, meta_id_mapping)
+                scraped_since_save = 0
 
     # Save the mapping
-    with open('data/meta_id_mapping.json', 'w') as f:
-        json.dump(meta_id_mapping, f, indent=2)
+    save_json_atomic(MAPPING_FILE, meta_id_mapping)
 
-    print(f"\n💾 Saved meta_id mapping to data/meta_id_mapping.json")
+    logger.info(f"\n💾 Saved meta_id mapping to {MAPPING_FILE}")
 
     # Now try to match our votes to the scraped meta_ids
-    print(f"\n🔗 Matching votes to meta_ids...")
+    logger.info(f"\n🔗 Matching votes to meta_ids...")
 
     matched_votes = 0
     total_votes = len(data['votes'])
 
+    # Lowercase and index every scraped agenda text once instead of on every comparison
+    agenda_indexes = {mid: build_agenda_index(meeting_meta_ids) for mid, meeting_meta_ids in meta_id_mapping.items()}
+
+    def match_agenda(meeting_id, item_lc):
+        """First meta_id whose agenda text contains, or is contained in, the lowercased agenda item"""
+        entries, by_token, by_interior, always = agenda_indexes[meeting_id]
+
+        item_interior = interior_tokens(item_lc)
+        if item_interior:
+            # A text containing the item has each of the item's interior tokens as a whole word,
+            # and an item containing a text has each of the text's interior tokens as a whole word
+            candidates = set(always)
+            for token in item_interior:
+                candidates |= by_token.get(token, set())
+            for token in word_tokens(item_lc):
+                candidates |= by_interior.get(token, set())
+            candidates = sorted(candidates)
+        else:
+            # Nothing to narrow on; check every text
+            candidates = range(len(entries))
+
+        # Same substring test and first-match order as before, on the narrowed candidates
+        for i in candidates:
+            text_lc, meta_id = entries[i]
+            if text_lc in item_lc or item_lc in text_lc:
+                return meta_id
+        return None
+
+    def resolve_meta_id(meeting_id, agenda_item):
+        """(meta_id, match kind) for an agenda item, trying an exact text match before a partial one"""
+        meeting_meta_ids = meta_id_mapping[meeting_id]
+        if agenda_item in meeting_meta_ids:
+            return meeting_meta_ids[agenda_item], 'Exact'
+        return match_agenda(meeting_id, agenda_item.lower()), 'Partial'
+
+    # Resolve each distinct (meeting, agenda item) once; votes from several frames share an agenda item
+    unique_items = {(vote['meeting_id'], vote.get('agenda_item', '')) for vote in data['votes']}
+    match_cache = {
+        (meeting_id, agenda_item): resolve_meta_id(meeting_id, agenda_item)
+        for meeting_id, agenda_item in unique_items
+        if meeting_id in meta_id_mapping and agenda_item
+    }
+
     for vote in data['votes']:
-        meeting_id = vote['meeting_id']
-        agenda_item = vote.get('agenda_item', '')
-
-        if meeting_id in meta_id_mapping and agenda_item:
-            # Try to find matching meta_id
-            meeting_meta_ids = meta_id_mapping[meeting_id]
-
-            # Look for exact match first
-            if agenda_item in meeting_meta_ids:
-                vote['meta_id'] = meeting_meta_ids[agenda_item]
-                matched_votes += 1
-                print(f"  ✅ Exact match: {agenda_item[:30]}... -> meta_id={vote['meta_id']}")
-            else:
-                # Try partial matches
-                for agenda_text, meta_id in meeting_meta_ids.items():
-                    if agenda_text.lower() in agenda_item.lower() or agenda_item.lower() in agenda_text.lower():
-                        vote['meta_id'] = meta_id
-                        matched_votes += 1
-                        print(f"  ✅ Partial match: {agenda_item[:30]}... -> meta_id={meta_id}")
-                        break
+        meta_id, match_kind = match_cache.get((vote['meeting_id'], vote.get('agenda_item', '')), (None, None))
+        if meta_id is not None:
+            vote['meta_id'] = meta_id
+            matched_votes += 1
+            logger.debug(f"  ✅ {match_kind} match: {vote['agenda_item'][:30]}... -> meta_id={meta_id}")
 
-    print(f"\n📊 Results:")
-    print(f"  Total votes: {total_votes}")
-    print(f"  Matched votes: {matched_votes}")
-    print(f"  Match rate: {(matched_votes/total_votes)*100:.1f}%")
+    logger.info(f"\n📊 Results:")
+    logger.info(f"  Total votes: {total_votes}")
+    logger.info(f"  Matched votes: {matched_votes}")
+    logger.info(f"  Match rate: {(matched_votes/total_votes)*100:.1f}%")
 
     # Save updated vote data
-    with open('data/torrance_votes_consolidated_final.json', 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json_bytes('data/torrance_votes_consolidated_final.json', data)
 
-    print(f"💾 Updated vote data with meta_ids")
+    logger.info(f"💾 Updated vote data with meta_ids")
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Scrape meta_ids from Granicus agenda pages')
+    parser.add_argument('--verbose', action='store_true', help='Log per-meeting detail')
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
     scrape_meta_ids()
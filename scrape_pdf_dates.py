@@ -3,117 +3,240 @@
 Extract meeting dates from PDF agenda documents
 """
 
+import argparse
+import logging
+import sys
 import requests
 import json
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import io
+import zlib
+from granicus_scrape import make_session, meetings_in_range, load_json_cache, save_json_atomic, NUMERIC_DATE, MONTH_DATE
 
-def extract_pdf_text(pdf_url):
-    """Extract text from PDF URL"""
-    try:
-        response = requests.get(pdf_url, timeout=10)
-        response.raise_for_status()
+# Per-meeting detail is logged at DEBUG (--verbose); warnings and the summary at INFO
+logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+logger = logging.getLogger(__name__)
 
-        # Simple PDF text extraction (basic approach)
-        # This is a simplified version - in practice you'd use PyPDF2 or similar
-        content = response.content
+# Meetings fetched at once; results are still reported on the main thread in meeting order
+FETCH_WORKERS = 16
 
-        # Look for text patterns in the PDF content
-        # PDFs often have text in readable format even if compressed
-        text_content = content.decode('utf-8', errors='ignore')
+# Scraped dates, also read back on the next run
+OUTPUT_FILE = 'scraped_pdf_2024_dates.json'
 
-        return text_content
-    except Exception as e:
-        print(f"Error extracting PDF text: {e}")
-        return ""
+# ETag / Last-Modified and scan result per PDF URL, so an unchanged PDF is answered with a 304 instead of its body
+VALIDATORS_FILE = 'scraped_pdf_2024_validators.json'
 
-def scrape_meeting_dates_from_pdfs():
-    """Scrape actual meeting dates from PDF agenda documents"""
+# Progress is saved after this many newly scraped results, so an interrupted run resumes where it stopped
+SAVE_EVERY = 10
 
-    # Load vote data
-    with open('data/torrance_votes_smart_consolidated.json', 'r') as f:
-        data = json.load(f)
+# Date formats compiled once into one alternation, so the PDF text is scanned a single time.
+# Dates are ASCII, so the pattern runs on the PDF bytes directly without decoding them first
+DATE_RE = re.compile(f'({MONTH_DATE}|{NUMERIC_DATE})'.encode('ascii'), re.IGNORECASE)
 
-    print("🔍 Scraping actual meeting dates from PDF agenda documents...")
+# Stream object delimiters; agenda page text is normally Flate-compressed between them
+PDF_STREAM_START_RE = re.compile(rb'(?<!end)stream\r?\n')
+PDF_STREAM_END_RE = re.compile(rb'\r?\n?endstream')
 
-    # Get all 2024 meetings
-    meetings_2024 = []
-    for meeting_id, meeting_data in data.get('meetings', {}).items():
-        if meeting_id.startswith('14') and int(meeting_id) < 14400:
-            meetings_2024.append((meeting_id, meeting_data))
+# Bytes held back at a chunk boundary, longer than either stream delimiter
+PDF_KEYWORD_OVERLAP = 16
 
-    print(f"Found {len(meetings_2024)} 2024 meetings to check")
+# PDFs are downloaded in chunks of this size and scanned as they arrive
+PDF_CHUNK_SIZE = 64 * 1024
 
-    # Scrape dates from PDF documents
-    scraped_dates = {}
+# Leading bytes kept from a PDF with no date, for the --verbose preview
+PDF_PREVIEW_BYTES = 500
 
-    for meeting_id, meeting_data in meetings_2024:
-        print(f"\n📋 Checking Meeting {meeting_id}...")
+# Bytes re-searched at each piece boundary, longer than any date the pattern matches
+DATE_OVERLAP = 64
 
-        # Use the correct agenda URL format
-        agenda_url = f"https://torrance.granicus.com/AgendaViewer.php?view_id=8&clip_id={meeting_id}"
+def inflate_pdf_stream(data):
+    """Inflated contents of a Flate-compressed stream, or the raw bytes for any other filter"""
+    try:
+        # decompressobj tolerates the trailing EOL some writers leave inside the stream
+        return zlib.decompressobj().decompress(data)
+    except zlib.error:
+        return data
+
+def iter_pdf_bytes(chunks):
+    """Yield PDF bytes as they arrive, inflating each stream object once all of it has arrived"""
+    # Bytes before a stream are yielded straight away, so the buffer only grows while a stream is pending
+    buffer = bytearray()
+    pending = False  # buffer holds the start of a stream body
+    end_from = 0  # where to resume looking for the pending stream's endstream
+    for chunk in chunks:
+        buffer += chunk
+
+        while True:
+            if not pending:
+                start = PDF_STREAM_START_RE.search(buffer)
+                if start is None:
+                    # Keep a short tail in case a "stream" keyword is split across chunks
+                    cut = max(len(buffer) - PDF_KEYWORD_OVERLAP, 0)
+                    yield bytes(buffer[:cut])
+                    del buffer[:cut]
+                    break
+                yield bytes(buffer[:start.end()])
+                del buffer[:start.end()]
+                pending = True
+                end_from = 0
+
+            # Only the newly arrived bytes (plus a keyword's worth of overlap) are searched
+            end = PDF_STREAM_END_RE.search(buffer, end_from)
+            if end is None:
+                end_from = max(len(buffer) - PDF_KEYWORD_OVERLAP, 0)
+                break
+            yield inflate_pdf_stream(bytes(buffer[:end.start()]))
+            del buffer[:end.end()]
+            pending = False
+    yield bytes(buffer)
+
+def extract_pdf_date(pdf_url, session, cached=None):
+    """Stream a PDF and search it as it arrives, returning (date_str, bytes scanned, preview, validator); a 304 for the cached validator returns its date and None scanned"""
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
 
-        try:
-            # Make request to get the PDF URL
-            session = requests.Session()
-            response = session.get(agenda_url, timeout=10, allow_redirects=True)
+    try:
+        with session.get(pdf_url, timeout=10, stream=True, headers=headers) as response:
+            if response.status_code == 304:
+                return cached.get('date'), None, b"", cached
             response.raise_for_status()
 
-            final_url = response.url
-            print(f"  PDF URL: {final_url}")
-
-            # Extract text from PDF
-            pdf_text = extract_pdf_text(final_url)
-
-            if pdf_text:
-                print(f"  PDF text length: {len(pdf_text)} characters")
-
-                # Look for date patterns in the PDF text
-                date_patterns = [
-                    r'(JANUARY|FEBRUARY|MARCH|APRIL|MAY|JUNE|JULY|AUGUST|SEPTEMBER|OCTOBER|NOVEMBER|DECEMBER)\s+\d{1,2},?\s+\d{4}',  # MONTH DD, YYYY
-                    r'(\d{1,2}/\d{1,2}/\d{4})',  # MM/DD/YYYY
-                    r'(\d{4}-\d{2}-\d{2})',      # YYYY-MM-DD
-                ]
-
-                date_found = False
-                for pattern in date_patterns:
-                    matches = re.findall(pattern, pdf_text, re.IGNORECASE)
-                    if matches:
-                        # Take the first date found
-                        date_str = matches[0]
-                        print(f"  Found date in PDF: {date_str}")
-                        scraped_dates[meeting_id] = date_str
-                        date_found = True
-                        break
+            validator = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'date': None
+            }
+
+            scanned = bytearray()
+            for piece in iter_pdf_bytes(response.iter_content(chunk_size=PDF_CHUNK_SIZE)):
+                # Re-search a short overlap so a date split across pieces is still found
+                search_from = max(len(scanned) - DATE_OVERLAP, 0)
+                scanned += piece
+                match = DATE_RE.search(scanned, search_from)
+                if match:
+                    validator['date'] = match.group(1).decode('ascii')
+                    return validator['date'], len(scanned), bytes(scanned[:PDF_PREVIEW_BYTES]), validator
+
+            # Only the length and a short preview leave this function, so the inflated PDF is freed here
+            return None, len(scanned), bytes(scanned[:PDF_PREVIEW_BYTES]), validator
+    except Exception as e:
+        logger.warning(f"Error extracting PDF text: {e}")
+        return None, 0, b"", None
 
-                if not date_found:
-                    print(f"  ❌ No date found in PDF for meeting {meeting_id}")
-                    # Print first 500 characters to see what we got
-                    print(f"  PDF preview: {pdf_text[:500]}...")
-            else:
-                print(f"  ❌ Could not extract text from PDF for meeting {meeting_id}")
+def agenda_url_for(meeting_id):
+    """Granicus agenda viewer URL, which redirects to the agenda PDF"""
+    return f"https://torrance.granicus.com/AgendaViewer.php?view_id=8&clip_id={meeting_id}"
 
-        except requests.exceptions.RequestException as e:
-            print(f"  ❌ Error accessing {agenda_url}: {e}")
-        except Exception as e:
-            print(f"  ❌ Error processing meeting {meeting_id}: {e}")
+def fetch_agenda_pdf(session, agenda_url, validators):
+    """Follow the agenda redirect to its PDF, returning (pdf_url, date_str, bytes scanned, preview, validator)"""
+    response = session.get(agenda_url, timeout=10, allow_redirects=True)
+    response.raise_for_status()
+    return (response.url, *extract_pdf_date(response.url, session, validators.get(response.url)))
+
+def scrape_meeting_dates_from_pdfs():
+    """Scrape actual meeting dates from PDF agenda documents"""
+
+    # Load vote data in one raw read; json.loads decodes the bytes itself
+    with open('data/torrance_votes_smart_consolidated.json', 'rb') as f:
+        data = json.loads(f.read())
+
+    logger.info("🔍 Scraping actual meeting dates from PDF agenda documents...")
+
+    # Get all 2024 meetings
+    meetings_2024 = meetings_in_range(data)
+
+    # Dates saved by earlier runs are kept; only meetings still missing one are scraped
+    scraped_dates = load_json_cache(OUTPUT_FILE)
+    saved_count = len(scraped_dates)
+    meetings_2024 = [(meeting_id, meeting_data) for meeting_id, meeting_data in meetings_2024 if meeting_id not in scraped_dates]
+
+    logger.info(f"Found {len(meetings_2024)} 2024 meetings to check ({saved_count} already scraped)")
+
+    # Validators are only written on this thread; workers just read them
+    validators = load_json_cache(VALIDATORS_FILE)
+
+    # Scrape dates from PDF documents
+    # Both downloads for a meeting are blocking I/O, so run whole meetings in a thread pool
+    # One session for every request so connections to Granicus are reused
+    session = make_session(FETCH_WORKERS)
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        pending = deque(executor.submit(fetch_agenda_pdf, session, agenda_url_for(meeting_id), validators) for meeting_id, _ in meetings_2024)
+
+        for meeting_id, meeting_data in meetings_2024:
+            # Take the future off the queue so its result is freed once this meeting is reported
+            future = pending.popleft()
+            logger.debug(f"\n📋 Checking Meeting {meeting_id}...")
+
+            # Use the correct agenda URL format
+            agenda_url = agenda_url_for(meeting_id)
+
+            try:
+                # Wait for the PDF URL and date scanned in the background
+                final_url, date_str, scanned_len, preview, validator = future.result()
+                logger.debug(f"  PDF URL: {final_url}")
+
+                if validator:
+                    validators[final_url] = validator
+
+                unchanged = scanned_len is None
+                if unchanged:
+                    logger.debug(f"  PDF unchanged since the last run")
+                elif scanned_len:
+                    logger.debug(f"  PDF text scanned: {scanned_len} bytes")
+
+                if unchanged or scanned_len:
+                    # The first date in the PDF text, found while it streamed (or on the last run)
+                    if date_str:
+                        logger.debug(f"  Found date in PDF: {date_str}")
+                        scraped_dates[meeting_id] = date_str
+                    else:
+                        logger.warning(f"  ❌ No date found in PDF for meeting {meeting_id}")
+                        if preview:
+                            # Print first 500 characters to see what we got
+                            logger.debug(f"  PDF preview: {preview.decode('utf-8', errors='ignore')}...")
+                else:
+                    logger.warning(f"  ❌ Could not extract text from PDF for meeting {meeting_id}")
+
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"  ❌ Error accessing {agenda_url}: {e}")
+            except Exception as e:
+                logger.warning(f"  ❌ Error processing meeting {meeting_id}: {e}")
+
+            # Checkpoint newly scraped dates periodically
+            if len(scraped_dates) - saved_count >= SAVE_EVERY:
+                save_json_atomic(OUTPUT_FILE, scraped_dates)
+                save_json_atomic(VALIDATORS_FILE, validators)
+                saved_count = len(scraped_dates)
 
     # Display results
-    print(f"\n📊 Scraping Results:")
-    print(f"   - Successfully scraped: {len(scraped_dates)} dates")
+    logger.info(f"\n📊 Scraping Results:")
+    logger.info(f"   - Successfully scraped: {len(scraped_dates)} dates")
 
     if scraped_dates:
-        print(f"\n🔍 Scraped Dates:")
+        logger.info(f"\n🔍 Scraped Dates:")
         for meeting_id, date_str in scraped_dates.items():
-            print(f"   - Meeting {meeting_id}: {date_str}")
+            logger.info(f"   - Meeting {meeting_id}: {date_str}")
 
     # Save scraped dates to file for review
-    with open('scraped_pdf_2024_dates.json', 'w') as f:
-        json.dump(scraped_dates, f, indent=2)
+    save_json_atomic(OUTPUT_FILE, scraped_dates)
+    save_json_atomic(VALIDATORS_FILE, validators)
 
-    print(f"\n💾 Scraped dates saved to 'scraped_pdf_2024_dates.json'")
-    print(f"   - Review the dates and update the main data file if they look correct")
+    logger.info(f"\n💾 Scraped dates saved to '{OUTPUT_FILE}'")
+    logger.info(f"   - Review the dates and update the main data file if they look correct")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Scrape meeting dates from PDF agenda documents')
+    parser.add_argument('--verbose', action='store_true', help='Log per-meeting detail')
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
     scrape_meeting_dates_from_pdfs()
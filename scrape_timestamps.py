@@ -6,63 +6,87 @@ This will fix the timestamp calculation issue.
 
 import json
 import re
-import subprocess
 import os
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from granicus_scrape import make_session
+from vote_data import write_json_bytes
+
+# Fetched player pages, reused on reruns so unchanged meetings are not downloaded again
+CACHE_DIR = '.cache'
+PAGE_CACHE_MAX_AGE = 24 * 60 * 60  # seconds
+
+# Player pages fetched at once, kept small to stay polite to Granicus; results are printed in meeting order
+FETCH_WORKERS = 4
+
+# Every time attribute in the player page, paired with a data-id in the same tag in either order,
+# e.g. time="456" data-id="123". The gap is bounded and cannot leave the tag, so there is no
+# DOTALL backtracking across the page
+TIME_ATTR_RE = re.compile(
+    r'time="(\d+)"(?:[^>]{0,200}?data-id="(\d+)")?'
+    r'|data-id="(\d+)"[^>]{0,200}?time="(\d+)"'
+)
+
+def fetch_player_page(session, meeting_id):
+    """HTML of a meeting's Granicus player page, from the local cache when fetched within PAGE_CACHE_MAX_AGE"""
+    cache_file = os.path.join(CACHE_DIR, f"granicus_clip_{meeting_id}.html")
+    if os.path.exists(cache_file) and time.time() - os.path.getmtime(cache_file) < PAGE_CACHE_MAX_AGE:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    response = session.get(f"https://torrance.granicus.com/player/clip/{meeting_id}", timeout=15)
+    response.raise_for_status()
+    html_content = response.text
+
+    # Write via a temp file so an interrupted run never leaves a partial page
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    temp_file = f"{cache_file}.tmp"
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        f.write(html_content)
+    os.replace(temp_file, cache_file)
+    return html_content
+
+def page_timestamps(html_content):
+    """(sorted timestamps, meta_id to timestamp mapping) from one pass over a Granicus player page."""
+    timestamps = []
+    meta_time_map = {}
+
+    for match in TIME_ATTR_RE.finditer(html_content):
+        if match.group(1):
+            time_str, meta_id = match.group(1), match.group(2)
+        else:
+            meta_id, time_str = match.group(3), match.group(4)
+
+        timestamps.append(int(time_str))
+        if meta_id:
+            meta_time_map[meta_id] = int(time_str)
 
-def scrape_video_timestamps(meeting_id):
-    """Scrape video timestamps from Granicus page."""
-    url = f"https://torrance.granicus.com/player/clip/{meeting_id}"
-
-    try:
-        result = subprocess.run(['curl', '-s', url], capture_output=True, text=True, check=True)
-        html_content = result.stdout
-
-        # Extract time attributes
-        time_pattern = r'time="(\d+)"'
-        timestamps = re.findall(time_pattern, html_content)
-
-        # Convert to integers and sort
-        timestamps = sorted([int(t) for t in timestamps])
-
-        print(f"  Found {len(timestamps)} timestamps: {timestamps[:10]}...")
-        return timestamps
-
-    except subprocess.CalledProcessError as e:
-        print(f"  Error scraping {url}: {e}")
-        return []
+    timestamps.sort()
 
-def scrape_meta_id_timestamps(meeting_id):
-    """Scrape meta_id to timestamp mapping from Granicus page."""
-    url = f"https://torrance.granicus.com/player/clip/{meeting_id}"
+    print(f"  Found {len(timestamps)} timestamps: {timestamps[:10]}...")
+    print(f"  Found {len(meta_time_map)} meta_id->time mappings")
+    if meta_time_map:
+        print(f"    Sample: {dict(list(meta_time_map.items())[:3])}")
+    return timestamps, meta_time_map
 
+def scrape_meeting(meeting_id, page):
+    """(timestamps, meta_id to timestamp mapping) from a meeting's Granicus page, fetched once in the background"""
     try:
-        result = subprocess.run(['curl', '-s', url], capture_output=True, text=True, check=True)
-        html_content = result.stdout
-
-        # Look for data-id and time patterns together
-        # Pattern: data-id="123" time="456" (can be on separate lines)
-        meta_time_pattern = r'time="(\d+)".*?data-id="(\d+)"'
-        matches = re.findall(meta_time_pattern, html_content, re.DOTALL)
+        html_content = page.result()
 
-        meta_time_map = {}
-        for time_str, meta_id in matches:
-            meta_time_map[meta_id] = int(time_str)
+    except requests.exceptions.RequestException as e:
+        print(f"  Error scraping meeting {meeting_id}: {e}")
+        return [], {}
 
-        print(f"  Found {len(meta_time_map)} meta_id->time mappings")
-        if meta_time_map:
-            print(f"    Sample: {dict(list(meta_time_map.items())[:3])}")
-        return meta_time_map
-
-    except subprocess.CalledProcessError as e:
-        print(f"  Error scraping {url}: {e}")
-        return {}
+    return page_timestamps(html_content)
 
 def update_vote_timestamps():
     """Update vote data with actual video timestamps."""
 
-    # Load current data
-    with open('data/torrance_votes_smart_consolidated.json', 'r') as f:
-        data = json.load(f)
+    # Load current data in one raw read; json.loads decodes the bytes itself
+    with open('data/torrance_votes_smart_consolidated.json', 'rb') as f:
+        data = json.loads(f.read())
 
     votes = data.get('votes', [])
     meetings = data.get('meetings', {})
@@ -70,22 +94,26 @@ def update_vote_timestamps():
     print(f"🔍 Processing {len(votes)} votes across {len(meetings)} meetings...")
 
     # Get unique meeting IDs
-    meeting_ids = set(vote.get('meeting_id') for vote in votes)
+    meeting_ids = list(set(vote.get('meeting_id') for vote in votes))
 
     # Scrape timestamps for each meeting
     meeting_timestamps = {}
     meeting_meta_timestamps = {}
 
-    for meeting_id in meeting_ids:
-        print(f"\n📋 Scraping meeting {meeting_id}...")
+    # One session for every request so connections to Granicus are reused
+    session = make_session(FETCH_WORKERS)
+
+    # Pages download on a thread pool; each is read here on the main thread in meeting order
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        pending = [executor.submit(fetch_player_page, session, meeting_id) for meeting_id in meeting_ids]
 
-        # Get all timestamps
-        timestamps = scrape_video_timestamps(meeting_id)
-        meeting_timestamps[meeting_id] = timestamps
+        for meeting_id, page in zip(meeting_ids, pending):
+            print(f"\n📋 Scraping meeting {meeting_id}...")
 
-        # Get meta_id to timestamp mapping
-        meta_timestamps = scrape_meta_id_timestamps(meeting_id)
-        meeting_meta_timestamps[meeting_id] = meta_timestamps
+            # Get all timestamps and the meta_id to timestamp mapping from one fetch of the page
+            timestamps, meta_timestamps = scrape_meeting(meeting_id, page)
+            meeting_timestamps[meeting_id] = timestamps
+            meeting_meta_timestamps[meeting_id] = meta_timestamps
 
     # Update votes with actual timestamps
     updated_votes = 0
@@ -117,8 +145,7 @@ def update_vote_timestamps():
     print(f"  Estimated timestamps: {len(votes) - updated_votes}")
 
     # Save updated data
-    with open('data/torrance_votes_smart_consolidated.json', 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json_bytes('data/torrance_votes_smart_consolidated.json', data)
 
     print(f"\n💾 Updated data saved")
 
@@ -9,9 +9,25 @@ import socketserver
 import json
 import os
 import urllib.parse
+from datetime import timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 
+# Content type by file suffix; anything else is served as plain text
+CONTENT_TYPES = {
+    '.json': 'application/json',
+    '.html': 'text/html',
+    '.js': 'application/javascript',
+    '.css': 'text/css'
+}
+
+# Seconds a browser may reuse a static file before revalidating it
+CACHE_MAX_AGE = 3600
+
 class TorranceVoteHandler(http.server.SimpleHTTPRequestHandler):
+    # Static files already read, keyed by filename: ((mtime_ns, size), (content, content_type, etag, mtime))
+    FILE_CACHE = {}
+
     def do_GET(self):
         # Parse the URL
         parsed_path = urllib.parse.urlparse(self.path)
@@ -33,27 +49,62 @@ class TorranceVoteHandler(http.server.SimpleHTTPRequestHandler):
             # For SPA routing, serve index.html for all non-file requests
             self.serve_file('index.html')
 
+    def load_file(self, filename):
+        """(content, content_type, etag, mtime) for a static file, read from disk only when it has changed"""
+        stat = os.stat(filename)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self.FILE_CACHE.get(filename)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        with open(filename, 'rb') as f:
+            content = f.read()
+
+        content_type = CONTENT_TYPES.get(Path(filename).suffix, 'text/plain')
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        entry = (content, content_type, etag, stat.st_mtime)
+        self.FILE_CACHE[filename] = (signature, entry)
+        return entry
+
+    def is_not_modified(self, etag, mtime):
+        """Whether the request's If-None-Match or If-Modified-Since says the browser already has this version"""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match:
+            return if_none_match.strip() == '*' or etag in [tag.strip() for tag in if_none_match.split(',')]
+
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return False
+            if since is None:
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            return int(mtime) <= since.timestamp()
+
+        return False
+
     def serve_file(self, filename):
         """Serve a static file"""
         try:
-            with open(filename, 'rb') as f:
-                content = f.read()
-
-            # Set appropriate content type
-            if filename.endswith('.json'):
-                content_type = 'application/json'
-            elif filename.endswith('.html'):
-                content_type = 'text/html'
-            elif filename.endswith('.js'):
-                content_type = 'application/javascript'
-            elif filename.endswith('.css'):
-                content_type = 'text/css'
-            else:
-                content_type = 'text/plain'
+            content, content_type, etag, mtime = self.load_file(filename)
+
+            if self.is_not_modified(etag, mtime):
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Cache-Control', f'public, max-age={CACHE_MAX_AGE}')
+                self.end_headers()
+                return
 
             self.send_response(200)
             self.send_header('Content-Type', content_type)
             self.send_header('Content-Length', str(len(content)))
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', self.date_time_string(mtime))
+            self.send_header('Cache-Control', f'public, max-age={CACHE_MAX_AGE}')
             self.end_headers()
             self.wfile.write(content)
 
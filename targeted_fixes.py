@@ -5,13 +5,14 @@ Only fixes the most critical issues without being overly aggressive.
 """
 
 import json
+from vote_data import write_json_bytes
 
 def targeted_fixes():
     """Apply targeted fixes for specific issues"""
 
-    # Load the data
-    with open('data/torrance_votes_smart_consolidated.json', 'r') as f:
-        data = json.load(f)
+    # Load the data in one raw read; json.loads decodes the bytes itself
+    with open('data/torrance_votes_smart_consolidated.json', 'rb') as f:
+        data = json.loads(f.read())
 
     print("=== TARGETED FIXES ===")
 
@@ -140,8 +141,7 @@ def targeted_fixes():
     print(f"  ✅ Recalculated stats for {len(all_councilmembers)} councilmembers")
 
     # Save the updated data
-    with open('data/torrance_votes_smart_consolidated.json', 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json_bytes('data/torrance_votes_smart_consolidated.json', data)
 
     print(f"\n✅ TARGETED FIXES COMPLETE!")
     print(f"📊 Summary:")
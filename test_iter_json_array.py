@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming JSON array reader in process_2021_complete
+"""
+
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from process_2021_complete import iter_json_array
+
+class IterJsonArrayTest(unittest.TestCase):
+    """Round-trip arrays through iter_json_array at chunk sizes that split items"""
+
+    CHUNK_SIZES = (1, 2, 3, 7, 64)
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def assert_round_trip(self, items, text=None):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(items) if text is None else text)
+        for chunk_size in self.CHUNK_SIZES:
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(list(iter_json_array(self.path, chunk_size)), items)
+
+    def test_floats_split_across_chunks(self):
+        self.assert_round_trip([1500.0, 0.25, -3.5e-7, 12e10, 7])
+
+    def test_random_floats_and_strings(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            items = [
+                rng.uniform(-1e6, 1e6) if rng.random() < 0.5 else 'é,]' * rng.randint(0, 3)
+                for _ in range(rng.randint(0, 8))
+            ]
+            self.assert_round_trip(items)
+
+    def test_whitespace_and_objects(self):
+        items = [{'meeting_id': '12001', 'votes': [1.5, 'yes']}, 'x', 2.0]
+        self.assert_round_trip(items, text=json.dumps(items, indent=2))
+
+    def test_unterminated_array(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('[1.5, 2')
+        with self.assertRaises(ValueError):
+            list(iter_json_array(self.path, 2))
+
+if __name__ == '__main__':
+    unittest.main()
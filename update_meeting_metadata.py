@@ -5,6 +5,7 @@ Update meeting metadata to reflect actual vote counts after deduplication
 
 import json
 import re
+from vote_data import write_json_bytes
 
 def update_meeting_metadata():
     # Load the data
@@ -58,8 +59,7 @@ def update_meeting_metadata():
     print(f"\n✅ Updated {meetings_updated} meetings with correct vote counts")
 
     # Save the updated data
-    with open('data/torrance_votes_smart_consolidated.json', 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json_bytes('data/torrance_votes_smart_consolidated.json', data)
 
     print("✅ Meeting metadata updated!")
 
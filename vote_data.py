@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Helpers shared by the scripts that update the consolidated vote data
+"""
+
+import difflib
+import json
+import re
+from collections import Counter
+
+# Canonical councilmember names keyed by the token that identifies them
+CANONICAL_NAMES = {
+    'mayor': 'GEORGE CHEN',
+    'chen': 'GEORGE CHEN',
+    'gerson': 'MIKE GERSON',
+    'kaji': 'JON KAJI',
+    'kalani': 'SHARON KALANI',
+    'lewis': 'BRIDGET LEWIS',
+    'mattucci': 'AURELIO MATTUCCI',
+    'sheikh': 'ASAM SHEIKH',
+}
+CANONICAL_NAME_RE = re.compile('|'.join(CANONICAL_NAMES), re.IGNORECASE)
+
+# Stats field incremented for each normalized vote result
+STAT_FIELDS = {'YES': 'yes_votes', 'NO': 'no_votes', 'ABSTAIN': 'abstentions'}
+
+# Minimum similarity ratio for the fuzzy agenda match fallback
+FUZZY_MATCH_CUTOFF = 0.85
+
+# Item numbers (with their letter, as in 10a), dates and dollar amounts; agenda items
+# differing only in these score as near-identical
+_NUMBER_RE = re.compile(r'\d+(?:[a-z]\b)?')
+
+def fuzzy_agenda_match(agenda_text, candidates, cutoff=FUZZY_MATCH_CUTOFF):
+    """Closest candidate to agenda_text whose numbers all agree with it, or None; both sides should be lowercased"""
+    numbers = _NUMBER_RE.findall(agenda_text)
+    for candidate in difflib.get_close_matches(agenda_text, candidates, n=3, cutoff=cutoff):
+        if _NUMBER_RE.findall(candidate) == numbers:
+            return candidate
+    return None
+
+def empty_councilmember_stats():
+    """Zeroed stats for one councilmember"""
+    return {'total_votes': 0, 'yes_votes': 0, 'no_votes': 0, 'abstentions': 0}
+
+def count_vote_pairs(votes):
+    """Count (councilmember, result) pairs across votes, given as dicts or VoteData-style objects with individual_votes"""
+    pair_counts = Counter()
+    for vote in votes:
+        if hasattr(vote, 'individual_votes'):
+            individual_votes = vote.individual_votes
+        else:
+            individual_votes = vote.get('individual_votes')
+
+        # Only the councilmember -> result mapping layout can be tallied
+        if isinstance(individual_votes, dict):
+            pair_counts.update(individual_votes.items())
+    return pair_counts
+
+def fold_vote_pairs(pair_counts, councilmember_stats=None, case_insensitive=False):
+    """Add counted (councilmember, result) pairs into stats; without councilmember_stats, everyone seen gets an entry, and case_insensitive matches results in any case"""
+    add_missing = councilmember_stats is None
+    if add_missing:
+        councilmember_stats = {}
+
+    # Each distinct pair is folded in once, however many votes it came from
+    for (councilmember, vote_result), count in pair_counts.items():
+        stats = councilmember_stats.get(councilmember)
+        if stats is None:
+            if not add_missing:
+                continue
+            stats = councilmember_stats[councilmember] = empty_councilmember_stats()
+
+        stats['total_votes'] += count
+        field = STAT_FIELDS.get(vote_result.upper() if case_insensitive else vote_result)
+        if field:
+            stats[field] += count
+
+    return councilmember_stats
+
+def calculate_councilmember_stats(votes, councilmember_names):
+    """Tally yes/no/abstain counts for each of the given councilmembers"""
+    councilmember_stats = {councilmember: empty_councilmember_stats() for councilmember in councilmember_names}
+    return fold_vote_pairs(count_vote_pairs(votes), councilmember_stats)
+
+def set_if_changed(record, key, value):
+    """Set record[key] to value, returning True if the stored value changed"""
+    if record.get(key) == value:
+        return False
+    record[key] = value
+    return True
+
+def write_json_bytes(path, data):
+    """Write data as indented JSON, encoded in one call and written through a 1 MiB buffer"""
+    with open(path, 'wb', buffering=1 << 20) as f:
+        f.write(json.dumps(data, indent=2).encode('utf-8'))